@@ -11,7 +11,6 @@ import onscale_client.common.client_settings as client_settings
 
 import onscale_client.sockets as sockets
 
-import onscale_client.account as account
 import onscale_client.client as client
 import onscale_client.estimate_results as estimate_results
 import onscale_client.job as job
@@ -30,6 +29,7 @@ from .configure import (
     clear_profiles,
     get_available_profiles,
     import_token,
+    invalidate_config_cache,
     switch_default_profile,
     ConfigOptions,
 )
@@ -2,7 +2,45 @@ import onscale_client.api.datamodel as datamodel
 import onscale_client.api.rest_api as rest_api
 from onscale_client.api.rest_api import rest_api as RestApi
 
-from typing import Optional, List
+from typing import Dict, FrozenSet, Optional, List
+
+# default max_node_cores for hpc definitions which do not specify one
+AWS_DEFAULT_MAX_NODE_CORES = 94
+DEFAULT_MAX_NODE_CORES = 58
+
+
+class HpcIndex:
+    """Lookup tables built once from the hpc list of an account"""
+
+    def __init__(self, hpc_list: List[datamodel.Hpc]):
+        """initializes the lookup tables for the given hpc list
+
+        :param hpc_list: list of datamodel.Hpc objects to index. The first hpc
+            found for a given id, region or cloud is the one indexed. Any hpc
+            without max_node_cores has it set to the default for its cloud.
+        """
+        self.by_id: Dict[str, datamodel.Hpc] = dict()
+        self.by_region: Dict[str, datamodel.Hpc] = dict()
+        self.by_cloud: Dict[str, datamodel.Hpc] = dict()
+        for hpc in hpc_list:
+            if hpc.max_node_cores is None:
+                if hpc.hpc_cloud == "AWS":
+                    hpc.max_node_cores = AWS_DEFAULT_MAX_NODE_CORES
+                else:
+                    hpc.max_node_cores = DEFAULT_MAX_NODE_CORES
+            if hpc.hpc_id is None:
+                continue
+            self.by_id.setdefault(hpc.hpc_id, hpc)
+            if hpc.hpc_region is not None:
+                self.by_region.setdefault(hpc.hpc_region, hpc)
+            if hpc.hpc_cloud is not None:
+                self.by_cloud.setdefault(hpc.hpc_cloud, hpc)
+        self.regions: FrozenSet[str] = frozenset(
+            hpc.hpc_region for hpc in hpc_list if hpc.hpc_region is not None
+        )
+        self.clouds: FrozenSet[str] = frozenset(
+            hpc.hpc_cloud for hpc in hpc_list if hpc.hpc_cloud is not None
+        )
 
 
 class Account:
@@ -18,7 +56,8 @@ class Account:
             onscale_client.Client.account() or onscale_client.Client.account_list()
         """
         self._data = account_data
-        self.hpc_list: Optional[List[datamodel.Hpc]] = None
+        self._hpc_list: Optional[List[datamodel.Hpc]] = None
+        self._hpc_index: Optional[HpcIndex] = None
         # the balance data is not needed and takes 2 seconds per account
         # so we don't call it every time
         # self.update_balance_data()
@@ -39,6 +78,23 @@ class Account:
         self.core_hours_available = balance_data.core_hours_available
         self.core_hour_allocation = balance_data.allocation_available
 
+    @property
+    def hpc_list(self) -> Optional[List[datamodel.Hpc]]:
+        return self._hpc_list
+
+    @hpc_list.setter
+    def hpc_list(self, hpc_list: Optional[List[datamodel.Hpc]]):
+        self._hpc_list = hpc_list
+        self._hpc_index = None
+
+    @property
+    def hpc_index(self) -> HpcIndex:
+        """lookup tables for the hpc list, built on first access after the hpc
+        list is set"""
+        if self._hpc_index is None:
+            self._hpc_index = HpcIndex(self._hpc_list or list())
+        return self._hpc_index
+
     @property
     def core_hour_balance(self):
         return self.core_hours_available
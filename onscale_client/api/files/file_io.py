@@ -30,12 +30,26 @@ from onscale_client.api.files.file_util import (
     BUFFER,
 )
 
-from onscale_client.common.client_settings import ClientSettings, import_tqdm_notebook
+from onscale_client.common.client_settings import ClientSettings, get_tqdm
 
-if import_tqdm_notebook():
-    from tqdm.notebook import tqdm  # type: ignore
-else:
-    from tqdm import tqdm  # type: ignore
+# session used for file transfers, and the process which created it
+_FILE_SESSION: Optional[requests.Session] = None
+_FILE_SESSION_PID: Optional[int] = None
+
+
+def _file_session() -> requests.Session:
+    """Returns the session used for file transfers within this process
+
+    Files are transferred to and from pre-signed storage urls rather than the
+    portal api, so a separate session is kept for them so that connections are
+    reused across files. Worker processes create a session of their own rather
+    than sharing the connections of their parent.
+    """
+    global _FILE_SESSION, _FILE_SESSION_PID
+    if _FILE_SESSION is None or _FILE_SESSION_PID != os.getpid():
+        _FILE_SESSION = requests.Session()
+        _FILE_SESSION_PID = os.getpid()
+    return _FILE_SESSION
 
 
 def download_decrypt_files(
@@ -113,13 +127,13 @@ def download_file(url: str, file_path: str) -> Response:
 
     if ClientSettings.getInstance().quiet_mode:
         with open(file_path, "wb") as sink:
-            response = requests.get(url, stream=True)
+            response = _file_session().get(url, stream=True)
             _ = stream.stream_response_to_file(response, path=sink)
     else:
-        response = requests.get(url, stream=True)
+        response = _file_session().get(url, stream=True)
         total_size_in_bytes = int(response.headers.get("content-length", 0))
         block_size = 1024  # 1 Kibibyte
-        progress_bar = tqdm(
+        progress_bar = get_tqdm()(
             total=total_size_in_bytes,
             unit="iB",
             unit_scale=True,
@@ -280,7 +294,7 @@ def upload_file(
         mime_type = guess_mime_type(context.file_path)
 
     if not ClientSettings.getInstance().quiet_mode:
-        progress_bar = tqdm(
+        progress_bar = get_tqdm()(
             total=size,
             unit="iB",
             unit_scale=True,
@@ -296,7 +310,7 @@ def upload_file(
             if ClientSettings.getInstance().quiet_mode:
                 _data = MultipartEncoder(fields=_fields)
                 _headers["Content-Type"] = _data.content_type
-                response = requests.post(_uri, data=_data, headers=_headers)
+                response = _file_session().post(_uri, data=_data, headers=_headers)
             else:
 
                 def progress_bar_update(pbar):
@@ -305,18 +319,18 @@ def upload_file(
 
                     return _update_pbar
 
-                with tqdm(
+                with get_tqdm()(
                     total=size, unit="iB", desc=f"> {file_name}", unit_scale=True
                 ) as progress_bar:
                     _data = MultipartEncoderMonitor.from_fields(
                         fields=_fields, callback=progress_bar_update(progress_bar)
                     )
                     _headers["Content-Type"] = _data.content_type
-                    response = requests.post(_uri, data=_data, headers=_headers)
+                    response = _file_session().post(_uri, data=_data, headers=_headers)
         else:
             _headers["Content-Type"] = "application/octet-stream"
             data = stream_buffer_in(source)
-            response = requests.post(_uri, data=data, headers=_headers)  # type: ignore
+            response = _file_session().post(_uri, data=data, headers=_headers)  # type: ignore
             if not ClientSettings.getInstance().quiet_mode:
                 progress_bar.update(BUFFER if BUFFER < size else size)
 
@@ -3,11 +3,14 @@ import requests
 import json
 import base64
 import shutil
+import tempfile
 import time
 
 from typing import List, Optional
 
+from requests.adapters import HTTPAdapter
 from requests.models import Response
+from requests_toolbelt import MultipartEncoder  # type: ignore
 from requests_toolbelt.downloadutils import stream  # type: ignore
 
 import onscale_client.api.datamodel as datamodel
@@ -25,16 +28,26 @@ from onscale_client.api.files.file_io import (
     upload_file,
 )
 
-from onscale_client.common.client_settings import ClientSettings, import_tqdm_notebook
-
-if import_tqdm_notebook():
-    from tqdm.notebook import tqdm  # type: ignore
-else:
-    from tqdm import tqdm  # type: ignore
+from onscale_client.common.client_settings import ClientSettings, get_tqdm
 
 
 MAX_RETRIES = 5
 RETRY_BACKOFF_SECONDS = 2
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+
+
+def _form_fields(data: dict) -> list:
+    """Returns the form fields for data in the order and format requests uses
+    when encoding a multipart body"""
+    fields = list()
+    for name, value in data.items():
+        if isinstance(value, (str, bytes)) or not hasattr(value, "__iter__"):
+            value = [value]
+        for v in value:
+            if v is not None:
+                fields.append((name, v if isinstance(v, bytes) else str(v)))
+    return fields
 
 
 class Singleton(type):
@@ -62,6 +75,23 @@ class RestApi(object, metaclass=Singleton):
         self.url = ""
         if portal is not None:
             self.url = f"https://{portal}.portal.onscale.com/api"
+        self.session = self._create_session()
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Creates the session used for network requests
+
+        A single session is shared by all requests so that connections to the
+        portal are kept alive and reused rather than re-established per request.
+        Retries are handled by the request methods themselves.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE
+        )
+        session.mount("https://", adapter)
+        session.headers["Connection"] = "keep-alive"
+        return session
 
     def initialize(self, portal: str, auth_token: str, debug_output: bool = False):
         """Initialize the RestApi object for makeing network requests
@@ -96,6 +126,14 @@ class RestApi(object, metaclass=Singleton):
         """
         return self.url
 
+    def close(self):
+        """Closes the pooled connections held by the network session
+
+        The session remains usable and will open new connections on the next
+        request.
+        """
+        self.session.close()
+
     def account_list(self) -> List[datamodel.AccountListResponse]:
         """Request the current users account list
 
@@ -1268,13 +1306,20 @@ class RestApi(object, metaclass=Singleton):
             raise
         return response.status_code > 0 and response.status_code < 300
 
-    def job_file_download(self, files: List[datamodel.JobFile], file_path: str):
+    def job_file_download(
+        self,
+        files: List[datamodel.JobFile],
+        file_path: str,
+        aes_key: Optional[str] = None,
+    ):
         """Download the decrypted file_name associatd with the job identified by job_id
 
         Args:
             files: List of datamodel.JobFile info identifying the files to be downloaded.
                 datamodel.JobFile information can be requested via RestApi.job_files_list()
             file_path: The path of the download directory
+            aes_key: The plaintext AES key for the job. If None it is requested using
+                RestApi.aes_key(). Defaults to None.
 
         Raises:
             ApiError: includes HTTP error code indicating error
@@ -1291,8 +1336,13 @@ class RestApi(object, metaclass=Singleton):
             job_id = files[0].job_id
             assert isinstance(job_id, str)
 
-            aes_key = self.aes_key(job_id)
-            temp_path = os.path.join(TEMP_DIR, job_id)
+            if not aes_key:
+                aes_key = self.aes_key(job_id).key.plaintext_key
+            decoded_key = base64.b64decode(aes_key)
+            # each download gets its own temp directory as downloads of the same
+            # job may run at the same time and each removes its directory
+            maybe_makedirs(TEMP_DIR)
+            temp_path = tempfile.mkdtemp(prefix=f"{job_id}_", dir=TEMP_DIR)
 
             file_contexts = list()
             for f in files:
@@ -1306,7 +1356,7 @@ class RestApi(object, metaclass=Singleton):
                     name=file_name,
                     uri=http_request.uri,
                     dirname=file_path,
-                    aes_key=base64.b64decode(aes_key.key.plaintext_key),
+                    aes_key=decoded_key,
                 )
 
                 file_contexts.append(context)
@@ -1339,7 +1389,11 @@ class RestApi(object, metaclass=Singleton):
             raise ApiError(e)
 
     def sim_file_download(
-        self, files: List[datamodel.JobFile], file_path: str, simulation_index: int
+        self,
+        files: List[datamodel.JobFile],
+        file_path: str,
+        simulation_index: int,
+        aes_key: Optional[str] = None,
     ):
         """Download the decrypted file_name associatd with the job identified by job_id
 
@@ -1349,6 +1403,8 @@ class RestApi(object, metaclass=Singleton):
             file_path: The path of the download directory
             simulation_index: The index of the simulation for which files are being downloaded.
                 This values is used for organizing the data when downloaded.
+            aes_key: The plaintext AES key for the job. If None it is requested using
+                RestApi.aes_key(). Defaults to None.
 
         Raises:
             ApiError: includes HTTP error code indicating error
@@ -1368,8 +1424,13 @@ class RestApi(object, metaclass=Singleton):
         try:
             job_id = files[0].job_id
             assert isinstance(job_id, str)
-            aes_key = self.aes_key(job_id)
-            temp_path = os.path.join(TEMP_DIR, job_id)
+            if not aes_key:
+                aes_key = self.aes_key(job_id).key.plaintext_key
+            decoded_key = base64.b64decode(aes_key)
+            # each download gets its own temp directory as downloads of the same
+            # job may run at the same time and each removes its directory
+            maybe_makedirs(TEMP_DIR)
+            temp_path = tempfile.mkdtemp(prefix=f"{job_id}_", dir=TEMP_DIR)
             decrypted_path = os.path.join(temp_path, "decrypted")
 
             file_contexts = list()
@@ -1384,7 +1445,7 @@ class RestApi(object, metaclass=Singleton):
                     name=file_name,
                     uri=http_request.uri,
                     dirname=file_path,
-                    aes_key=base64.b64decode(aes_key.key.plaintext_key),
+                    aes_key=decoded_key,
                 )
 
                 file_contexts.append(context)
@@ -1748,14 +1809,14 @@ class RestApi(object, metaclass=Singleton):
 
                 if ClientSettings.getInstance().quiet_mode:
                     with open(file_path, "wb") as sink:
-                        res = requests.get(
+                        res = self.session.get(
                             f"{self.url}/blob/download/{b.blob_id}",
                             headers=self.json_headers(),
                             stream=True,
                         )
                         _ = stream.stream_response_to_file(res, path=sink)
                 else:
-                    res = requests.get(
+                    res = self.session.get(
                         f"{self.url}/blob/download/{b.blob_id}",
                         headers=self.json_headers(),
                         stream=True,
@@ -1764,7 +1825,7 @@ class RestApi(object, metaclass=Singleton):
                     total_size_in_bytes: Optional[int] = None
                     if isinstance(b.file_size, int):
                         total_size_in_bytes = b.file_size
-                    progress_bar = tqdm(
+                    progress_bar = get_tqdm()(
                         total=total_size_in_bytes,
                         unit="iB",
                         unit_scale=True,
@@ -1948,7 +2009,7 @@ class RestApi(object, metaclass=Singleton):
                     if data is not None:
                         print(f"data: {data}")
 
-                res = requests.post(
+                res = self.session.post(
                     url=f"{self.url}{endpoint}", headers=self.json_headers(), data=data
                 )
 
@@ -2003,10 +2064,7 @@ class RestApi(object, metaclass=Singleton):
         except requests.HTTPError as e:
             raise ApiError(e)
 
-        responseList = list()
-        for obj in res.json():
-            responseList.append(expected_class(**obj))
-        return responseList
+        return [expected_class(**obj) for obj in res.json()]
 
     def post_file(self, endpoint: str, file: str, payload=None, expected_class=None):
         """call POST request to upload file using endpoint with associated payload
@@ -2034,12 +2092,18 @@ class RestApi(object, metaclass=Singleton):
                         print(f"data: {data}")
                         print("files: {'file': open('" + file + "', 'rb')}")
 
-                res = requests.post(
-                    url=f"{self.url}{endpoint}",
-                    headers=headers,
-                    data=json.loads(data),
-                    files={"file": open(file, "rb")},
-                )
+                # the file is streamed into the request body rather than being
+                # read in to memory in full
+                with open(file, "rb") as source:
+                    fields = _form_fields(json.loads(data) if data else dict())
+                    fields.append(("file", (os.path.basename(file), source)))
+                    encoder = MultipartEncoder(fields=fields)
+                    headers["Content-Type"] = encoder.content_type
+                    res = self.session.post(
+                        url=f"{self.url}{endpoint}",
+                        headers=headers,
+                        data=encoder,
+                    )
 
                 if self.debug_output:
                     print(f"response: {res}")
@@ -2090,7 +2154,7 @@ class RestApi(object, metaclass=Singleton):
                     if data is not None:
                         print(f"data: {data}")
 
-                res = requests.get(
+                res = self.session.get(
                     f"{self.url}{endpoint}",
                     headers=self.json_headers(),
                     params=params,
@@ -2132,7 +2196,7 @@ class RestApi(object, metaclass=Singleton):
             try:
                 maybe_makedirs(os.path.dirname(file_path))
                 with open(file_path, "wb") as sink:
-                    res = requests.get(
+                    res = self.session.get(
                         f"{self.url}{endpoint}",
                         headers=self.json_headers(),
                         stream=True,
@@ -2175,10 +2239,7 @@ class RestApi(object, metaclass=Singleton):
         except requests.HTTPError as e:
             raise ApiError(e)
 
-        responseList = list()
-        for obj in response.json():
-            responseList.append(expected_class(**obj))
-        return responseList
+        return [expected_class(**obj) for obj in response.json()]
 
     def delete(self, endpoint: str, expected_class=None, payload=None):
         """call GET request to given endpoint with associated payload
@@ -2203,7 +2264,7 @@ class RestApi(object, metaclass=Singleton):
                     if data is not None:
                         print(f"json: {data}")
 
-                res = requests.delete(
+                res = self.session.delete(
                     f"{self.url}{endpoint}", headers=self.json_headers(), data=data
                 )
 
@@ -2245,10 +2306,7 @@ class RestApi(object, metaclass=Singleton):
         except requests.HTTPError as e:
             raise ApiError(e)
 
-        responseList = list()
-        for obj in response.json():
-            responseList.append(expected_class(**obj))
-        return responseList
+        return [expected_class(**obj) for obj in response.json()]
 
 
 rest_api = RestApi()
@@ -1,19 +1,24 @@
 import shutil
-import botocore.errorfactory  # type: ignore
 import os
 import datetime
 import json
-import getpass
-import copy
 import tempfile
 import base64
-
-from shutil import copyfile
+import functools
+import hashlib
+import hmac
+import reprlib
+import stat
+import time
+import types
+
+from concurrent.futures import ThreadPoolExecutor
 from onscale_client.estimate_data import EstimateData
 
+from jose import jwt, JWTError  # type: ignore
 from tabulate import tabulate
 
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Mapping, Optional, Tuple, Union
 
 import onscale_client.api.rest_api as rest_api
 import onscale_client.api.datamodel as datamodel
@@ -23,13 +28,14 @@ from onscale_client.api.util import wait_for_blob, wait_for_child_blob
 
 from onscale_client.job import Job
 from onscale_client.simulation import Simulation as SimulationData
-from onscale_client.account import Account
-from onscale_client.auth.cognito import Cognito
+from onscale_client.account import Account, HpcIndex
 from onscale_client.configure import (
     get_available_profiles,
     get_config_account_name,
     get_config_portal,
     get_config_developer_token,
+    get_onscale_dir,
+    remove_token_profiles,
 )
 from onscale_client.common.client_pools import (
     PortalTarget,
@@ -37,6 +43,8 @@ from onscale_client.common.client_pools import (
     ClientTestPools,
     PortalHost,
     ClientProductionPools,
+    PORTAL_CANONICAL,
+    PORTAL_TARGETS,
 )
 from onscale_client.common.client_settings import ClientSettings, TEMP_DIR
 from onscale_client.common.misc import is_dev_token, is_uuid, OS_DEFAULT_PROFILE
@@ -52,6 +60,145 @@ from onscale.visitors import (
 
 from onscale.reader import load_module, load_sims  # type: ignore
 
+# cached id tokens are discarded this many seconds before they expire
+ID_TOKEN_EXPIRY_MARGIN_SECONDS = 30
+
+# iterations of the salted password hash stored with cached id tokens
+PASSWORD_VERIFIER_ITERATIONS = 100000
+
+# id tokens shared by every Client in the process, keyed by (portal, pool id,
+# user name) and stored with their expiry time and the salt and hash of the
+# password they were requested with
+_ID_TOKEN_CACHE: Dict[Tuple[str, str, str], Tuple[str, float, bytes, bytes]] = {}
+
+# os.O_NOFOLLOW is not available on all platforms
+_O_NOFOLLOW = getattr(os, "O_NOFOLLOW", 0)
+
+# cached account lists are requested again once older than this many seconds
+ACCOUNT_CACHE_TTL_SECONDS = 300
+
+# cached material lists are requested again once older than this many seconds
+MATERIAL_CACHE_TTL_SECONDS = 10
+
+# bounded repr used for Client attributes so large containers are elided
+_ATTR_REPR = reprlib.Repr()
+_ATTR_REPR.maxdict = 4
+_ATTR_REPR.maxlist = 4
+_ATTR_REPR.maxstring = 120
+_ATTR_REPR.maxother = 120
+
+# (pool id, pool web client id, pool region, host) for each portal target
+_PORTAL_CONFIG = {
+    PortalTarget.Production.value: (
+        ClientProductionPools.PoolId.value,
+        ClientProductionPools.PoolWebClientId.value,
+        ClientProductionPools.PoolRegion.value,
+        PortalHost.Production.value,
+    ),
+    PortalTarget.Development.value: (
+        ClientDevelopmentPools.PoolId.value,
+        ClientDevelopmentPools.PoolWebClientId.value,
+        ClientDevelopmentPools.PoolRegion.value,
+        PortalHost.Development.value,
+    ),
+    PortalTarget.Test.value: (
+        ClientTestPools.PoolId.value,
+        ClientTestPools.PoolWebClientId.value,
+        ClientTestPools.PoolRegion.value,
+        PortalHost.Test.value,
+    ),
+}
+
+# input file extensions keyed by the solver family prefix of the operation string
+_INPUT_FAMILY_EXTENSIONS: Mapping[str, str] = types.MappingProxyType(
+    {
+        "REFLEX": ".json",
+        "MOEBIUS": ".py",
+        "OPENFOAM": ".json",
+        "BUILD": ".bldinp",
+        "REVIEW": ".revinp",
+    }
+)
+
+
+def _owned_by_current_user(file_stat: os.stat_result) -> bool:
+    """Returns True if file_stat belongs to the current user. Ownership cannot be
+    checked on platforms without user ids so is assumed."""
+    return not hasattr(os, "getuid") or file_stat.st_uid == os.getuid()
+
+
+def _password_verifier(password: str, salt: bytes) -> bytes:
+    """Returns the salted hash of password stored with a cached id token, which a
+    later login must match before the token is reused"""
+    return hashlib.pbkdf2_hmac(
+        "sha256", password.encode("utf-8"), salt, PASSWORD_VERIFIER_ITERATIONS
+    )
+
+
+def _private_cache_dir() -> Optional[str]:
+    """Returns the directory used to cache login data, which is created in the
+    user's onscale directory and is accessible by the current user only
+
+    Returns:
+        The cache directory, or None if it cannot be created or is not private
+        to the current user
+    """
+    onscale_dir = get_onscale_dir()
+    cache_dir = os.path.join(onscale_dir, "cache")
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        if not _owned_by_current_user(os.stat(onscale_dir)):
+            return None
+        cache_stat = os.lstat(cache_dir)
+        if not stat.S_ISDIR(cache_stat.st_mode) or not _owned_by_current_user(
+            cache_stat
+        ):
+            return None
+        if cache_stat.st_mode & 0o077:
+            os.chmod(cache_dir, 0o700)
+    except OSError:
+        return None
+    return cache_dir
+
+
+def _api_error_status(e: rest_api.ApiError) -> Optional[int]:
+    """Returns the HTTP status code of the response which caused e, if known"""
+    response = e.response
+    if response is None and e.args:
+        # errors raised from a requests.HTTPError hold it as their argument
+        response = getattr(e.args[0], "response", None)
+    return getattr(response, "status_code", None)
+
+
+def _family_input_extension(operation: str) -> str:
+    """Resolves the input extension for an operation from its solver family prefix"""
+    return _INPUT_FAMILY_EXTENSIONS.get(operation.partition("_")[0], ".flxinp")
+
+
+# input file extensions keyed by both the datamodel operation enum members and
+# their canonical strings. The string keys are the interned enum values so lookups
+# for operations originating from the datamodel resolve on the identity check of
+# the dict probe.
+_INPUT_EXTENSIONS: Mapping[
+    Union[str, datamodel.Operation], str
+] = types.MappingProxyType(
+    {
+        key: _family_input_extension(op.value)
+        for op in datamodel.Operation
+        for key in (op, op.value)
+    }
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _input_extension_from_operation(operation: Union[str, datamodel.Operation]) -> str:
+    """Memoized implementation of Client._input_from_operation"""
+    extension = _INPUT_EXTENSIONS.get(operation)
+    if extension is not None:
+        return extension
+    return _family_input_extension(str(operation))
+
+
 class Client(object):
     """The OnScale Cloud Client class
 
@@ -71,6 +218,7 @@ class Client(object):
         quiet_mode: bool = False,
         debug_mode: bool = False,
         skip_login: bool = False,
+        prefetch_hpc: bool = True,
     ):
         """Client constructor
 
@@ -94,6 +242,10 @@ class Client(object):
             quiet_mode: Suppresses all output. Defaults to False.
             debug_mode: Produces output which may be useful for debugging.
                 Defaults to False.
+            skip_login: Constructs the client without logging in. Defaults to False.
+            prefetch_hpc: Requests the hpc lists for all available accounts
+                concurrently on login so that switching accounts does not require
+                further requests. Defaults to True.
 
         Raises:
             TypeError: Error thrown when incorrect argument is passed
@@ -130,21 +282,25 @@ class Client(object):
             portal_target = PortalTarget.Production.value
         if not isinstance(portal_target, str):
             raise TypeError("TypeError: attr portal_target must be str")
-        if portal_target not in PortalTarget.LIST.value:
+        if portal_target not in PORTAL_TARGETS:
             raise NotImplementedError(
                 "NotImplementedError: attr portal_target is not available"
             )
-        if portal_target == "develoment":
-            portal_target = "dev"
-        if portal_target == "production":
-            portal_target = "prod"
+        portal_target = PORTAL_CANONICAL[portal_target]
 
         self.__portal_target = portal_target
         self.__user_name = user_name
         self.__password = password
         self.__account_list: Dict[str, Account] = dict()
+        self.__account_by_id: Dict[str, Account] = dict()
+        self.__hpc_cache: Dict[str, List[datamodel.Hpc]] = dict()
+        self.__material_cache: Dict[str, Tuple[float, list]] = dict()
+        self.__prefetch_hpc = prefetch_hpc
         self.__current_account_id: Optional[str] = None
         self.__id_token: Optional[str] = None
+        self.__id_token_key: Optional[Tuple[str, str, str]] = None
+        self.__id_token_cache_file: Optional[str] = None
+        self.__account_cache_file: Optional[str] = None
         self.__dev_token: Optional[str] = None
 
         self.settings = ClientSettings(quiet_mode, debug_mode)
@@ -152,23 +308,15 @@ class Client(object):
         if self.__portal_target is None:
             self.__portal_target = PortalTarget.Production.value
 
-        if self.__portal_target == PortalTarget.Production.value:
-            self.__pool_id = ClientProductionPools.PoolId.value
-            self.__pool_web_id = ClientProductionPools.PoolWebClientId.value
-            self.__pool_region = ClientProductionPools.PoolRegion.value
-            self.__host = PortalHost.Production.value
-        elif self.__portal_target == PortalTarget.Development.value:
-            self.__pool_id = ClientDevelopmentPools.PoolId.value
-            self.__pool_web_id = ClientDevelopmentPools.PoolWebClientId.value
-            self.__pool_region = ClientDevelopmentPools.PoolRegion.value
-            self.__host = PortalHost.Development.value
-        elif self.__portal_target == PortalTarget.Test.value:
-            self.__pool_id = ClientTestPools.PoolId.value
-            self.__pool_web_id = ClientTestPools.PoolWebClientId.value
-            self.__pool_region = ClientTestPools.PoolRegion.value
-            self.__host = PortalHost.Test.value
-        else:
+        portal_config = _PORTAL_CONFIG.get(self.__portal_target)
+        if portal_config is None:
             raise NotImplementedError("NotImplementedError: unknown portal_target name")
+        (
+            self.__pool_id,
+            self.__pool_web_id,
+            self.__pool_region,
+            self.__host,
+        ) = portal_config
 
         if skip_login is False:
             self.login(alias, user_name, password, account_id, account_name)
@@ -190,7 +338,7 @@ class Client(object):
             elif v is None:
                 continue
             else:
-                attrs.append(f"{k}={str(v)}")
+                attrs.append(f"{k}={_ATTR_REPR.repr(v)}")
         joined = ", ".join(attrs)
         return f"{type(self).__name__}({joined})"
 
@@ -277,12 +425,7 @@ class Client(object):
         if len(self.__account_list) == 0:
             raise RuntimeError("RuntimeError: no accounts available for this user")
 
-        matches_any_account_id = False
-        for idx, acc in enumerate(self.account_list.values()):
-            if acc.account_id == account_id:
-                matches_any_account_id = True
-                break
-        return matches_any_account_id
+        return account_id in self.__account_by_id
 
     def _check_account_name_exists(self, account_name: str) -> bool:
         """Check account given by account_name exists in the list of available accounts
@@ -296,12 +439,7 @@ class Client(object):
         if len(self.__account_list) == 0:
             raise RuntimeError("RuntimeError: no accounts available for this user")
 
-        matches_any_account_name = False
-        for idx, acc in enumerate(self.account_list.values()):
-            if acc.account_name == account_name:
-                matches_any_account_name = True
-                break
-        return matches_any_account_name
+        return account_name in self.__account_list
 
     def _set_current_account_by_id(self, account_id: str):
         """Sets the current account based upon the id to that is passed in as an argument,
@@ -310,21 +448,19 @@ class Client(object):
           Args:
               account_id: UUID for the selected account
         """
+        if len(self.__account_list) == 0:
+            raise RuntimeError("RuntimeError: no accounts available for this user")
         if not isinstance(account_id, str):
             raise TypeError("TypeError: attr account_id type must be str")
         if not is_uuid(account_id):
             raise TypeError("TypeError: attr account_id type must be UUID")
-        if len(self.__account_list) == 0:
-            raise RuntimeError("RuntimeError: no accounts available for this user")
 
-        for key, acc in self.__account_list.items():
-            if acc.account_id == account_id:
-                self.__current_account_id = account_id
-                acc.hpc_list = self.get_hpc_list(self.__current_account_id)
-                return
+        acc = self.__account_by_id.get(account_id)
+        if acc is None:
+            print("> ERROR - Account not found!")
+            return
 
-        print("> ERROR - Account not found!")
-        return
+        self.__current_account_id = account_id
 
     def _set_current_account_by_name(self, account_name: str):
         """Sets the current account based upon the account_name passed in as an argument
@@ -338,14 +474,13 @@ class Client(object):
         if len(self.__account_list) == 0:
             raise RuntimeError("RuntimeError: no accounts available for this user")
 
-        for key, acc in self.__account_list.items():
-            if acc.account_name == account_name:
-                self._set_current_account_by_id(acc.account_id)
-                acc.hpc_list = self.get_hpc_list(self.__current_account_id)
-                return
+        acc = self.__account_list.get(account_name)
+        if acc is None:
+            print("> ERROR - Account not found!")
+            return
 
-        print("> ERROR - Account not found!")
-        return
+        # the account came from the list so its id needs no further validation
+        self.__current_account_id = acc.account_id
 
     @property
     def current_account_name(self) -> str:
@@ -355,11 +490,10 @@ class Client(object):
         Returns:
           string containing the account name
         """
-        for key, acc in self.__account_list.items():
-            if acc.account_id == self.__current_account_id:
-                return acc.account_name
-
-        return ""
+        acc = self.current_account
+        if acc is None:
+            return ""
+        return acc.account_name
 
     @property
     def current_account(self) -> Optional[Account]:
@@ -368,11 +502,9 @@ class Client(object):
         Returns:
           Account object
         """
-        for key, acc in self.__account_list.items():
-            if acc.account_id == self.__current_account_id:
-                return acc
-
-        return None
+        if self.__current_account_id is None:
+            return None
+        return self.__account_by_id.get(self.__current_account_id)
 
     @property
     def account_list(self) -> dict:
@@ -397,10 +529,7 @@ class Client(object):
           >>> print(client.account_names())
           ['OnScale Account 1', 'OnScale Account 2']
         """
-        returnList = list()
-        for key in self.account_list.keys():
-            returnList.append(key)
-        return returnList
+        return list(self.__account_list)
 
     def account_ids(self) -> List[str]:
         """Returns a list of account ids of the accounts available to the currently
@@ -415,10 +544,7 @@ class Client(object):
            >>> print(client.account_ids())
            ['0954e70b-237a-4cdb-a267-b5da0f67dd70', '094e650b-237a-3e4d-a267-b5da0f67cd31']
         """
-        return_ids = list()
-        for key, acc in self.__account_list.items():
-            return_ids.append(acc.account_id)
-        return return_ids
+        return list(self.__account_by_id)
 
     def account(self, name: str) -> Account:
         """Returns an account object for the account identified by the name passed
@@ -467,6 +593,9 @@ class Client(object):
         """Returns a list of HPC objects containing info on the available
         HPC's for the account_id specified.
 
+        The list is requested once per account and cached for subsequent calls.
+        Use invalidate_hpc_cache() to force the list to be requested again.
+
         Args:
           account_id: The account id to request the hpc list for
 
@@ -488,14 +617,75 @@ class Client(object):
         if ClientSettings.getInstance().debug_mode:
             print("get_hpc_list: ")
 
+        cached_list = self.__hpc_cache.get(account_id)
+        if cached_list is not None:
+            return cached_list
+
         hpc_list: List[datamodel.Hpc] = list()
         try:
             hpc_list = RestApi.hpc_list(account_id)
         except rest_api.ApiError as e:
             print(f"APIError raised - {str(e)}")
+            self._on_account_api_error(e)
+            return hpc_list
 
+        self.__hpc_cache[account_id] = hpc_list
         return hpc_list
 
+    def _prefetch_hpc_lists(self):
+        """Requests the hpc lists for all available accounts which have not already
+        been cached, making the requests concurrently.
+        """
+        account_ids = [
+            account_id
+            for account_id in self.__account_by_id
+            if account_id not in self.__hpc_cache and is_uuid(account_id)
+        ]
+        if not account_ids:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(8, len(account_ids))) as executor:
+            hpc_lists = executor.map(self.get_hpc_list, account_ids)
+            for account_id, hpc_list in zip(account_ids, hpc_lists):
+                self.__account_by_id[account_id].hpc_list = hpc_list
+
+    def invalidate_hpc_cache(self, account_id: Optional[str] = None):
+        """Clears the cached HPC list for the account_id specified, or for all
+        accounts if no account_id is given.
+
+        Args:
+          account_id: The account id to clear the cached hpc list for.
+            Defaults to None.
+
+        Example:
+          >>> import onscale_client as os
+          >>> client = os.Client()
+          >>> client.invalidate_hpc_cache(client.current_account_id)
+        """
+        if account_id is None:
+            self.__hpc_cache.clear()
+            for acc in self.__account_list.values():
+                acc.hpc_list = None
+        else:
+            self.__hpc_cache.pop(account_id, None)
+            acc = self.__account_by_id.get(account_id)
+            if acc is not None:
+                acc.hpc_list = None
+
+    def _current_hpc_index(self) -> HpcIndex:
+        """Returns the hpc lookup tables for the current account
+
+        Reuses the hpc list held by the current account when it has already been
+        populated, otherwise requests it and stores it on the account.
+        """
+        acc = self.current_account
+        if not isinstance(acc, Account):
+            return HpcIndex(list())
+
+        if not acc.hpc_list:
+            acc.hpc_list = self.get_hpc_list(acc.account_id)
+        return acc.hpc_index
+
     def available_hpc_regions(self) -> List[str]:
         """returns the available hpc region names for the current account
 
@@ -509,24 +699,7 @@ class Client(object):
             >>> print(hpc_list)
             ['us-east-1', 'us-east-2']
         """
-        if not isinstance(self.current_account, Account):
-            return list()
-
-        if (
-            self.current_account.hpc_list is None
-            or len(self.current_account.hpc_list) == 0
-        ):
-            self.current_account.hpc_list = self.get_hpc_list(
-                self.current_account.account_id
-            )
-
-        if not isinstance(self.current_account.hpc_list, list):
-            return list()
-
-        return_list: set = set()
-        for hpc in self.current_account.hpc_list:
-            return_list.add(hpc.hpc_region)
-        return list(return_list)
+        return list(self._current_hpc_index().regions)
 
     def available_hpc_clouds(self) -> List[str]:
         """Returns the available hpc_clouds for the current account
@@ -541,24 +714,7 @@ class Client(object):
             >>> print(hpc_clouds)
             ['AWS', 'GCP']
         """
-        if not isinstance(self.current_account, Account):
-            return list()
-
-        if (
-            self.current_account.hpc_list is None
-            or len(self.current_account.hpc_list) == 0
-        ):
-            self.current_account.hpc_list = self.get_hpc_list(
-                self.current_account.account_id
-            )
-
-        if not isinstance(self.current_account.hpc_list, list):
-            return list()
-
-        return_list: set = set()
-        for hpc in self.current_account.hpc_list:
-            return_list.add(hpc.hpc_cloud)
-        return list(return_list)
+        return list(self._current_hpc_index().clouds)
 
     def get_hpc_id_from_region(self, region: str) -> str:
         """Returns the hpc_id for the given region, based upon the current
@@ -578,11 +734,9 @@ class Client(object):
         if not isinstance(region, str):
             raise ValueError("region must be of type str")
 
-        hpc_list = self.get_hpc_list(self.current_account_id)
-        for hpc in hpc_list:
-            if region == hpc.hpc_region:
-                if hpc.hpc_id is not None:
-                    return hpc.hpc_id
+        hpc = self._current_hpc_index().by_region.get(region)
+        if hpc is not None:
+            return hpc.hpc_id
         print("> ERROR - Invalid region specified")
         return ""
 
@@ -603,11 +757,9 @@ class Client(object):
         if not isinstance(cloud, str):
             raise ValueError("cloud must be of type str")
 
-        hpc_list = self.get_hpc_list(self.current_account_id)
-        for hpc in hpc_list:
-            if cloud == hpc.hpc_cloud:
-                if hpc.hpc_id is not None:
-                    return hpc.hpc_id
+        hpc = self._current_hpc_index().by_cloud.get(cloud)
+        if hpc is not None:
+            return hpc.hpc_id
         print("> ERROR - Invalid cloud specified")
         return ""
 
@@ -628,11 +780,9 @@ class Client(object):
         if not isinstance(hpc_id, str):
             raise ValueError("cloud must be of type str")
 
-        hpc_list = self.get_hpc_list(self.current_account_id)
-        for hpc in hpc_list:
-            if hpc_id == hpc.hpc_id:
-                if hpc.hpc_cloud is not None:
-                    return hpc.hpc_cloud
+        hpc = self._current_hpc_index().by_id.get(hpc_id)
+        if hpc is not None and hpc.hpc_cloud is not None:
+            return hpc.hpc_cloud
         print("> ERROR - Invalid cloud specified")
         return ""
 
@@ -653,15 +803,9 @@ class Client(object):
         if not isinstance(hpc_id, str):
             raise ValueError("hpc_id must be of type str")
 
-        hpc_list = self.get_hpc_list(self.current_account_id)
-        for hpc in hpc_list:
-            if hpc_id == hpc.hpc_id:
-                if hpc.max_node_cores is None:
-                    if hpc.hpc_cloud == "AWS":
-                        hpc.max_node_cores = 94
-                    else:
-                        hpc.max_node_cores = 58
-                return hpc
+        hpc = self._current_hpc_index().by_id.get(hpc_id)
+        if hpc is not None:
+            return hpc
         print("> ERROR - Invalid cloud specified")
         raise ValueError("No HPC Found")
 
@@ -684,7 +828,13 @@ class Client(object):
 
             self.__user_name = user_name
             self.__password = password
-            self.__id_token = self._get_cognito_id_token(user_name, password)
+            self.__id_token_key = (self.__portal_target, self.__pool_id, user_name)
+            self.__id_token_cache_file = self._id_token_cache_file(user_name)
+            id_token = self._load_cached_id_token(password)
+            if id_token is None:
+                id_token = self._get_cognito_id_token(user_name, password)
+                self._store_cached_id_token(id_token, password)
+            self.__id_token = id_token
             auth_token = self.__id_token
         else:
             if alias is None:
@@ -739,6 +889,11 @@ class Client(object):
           >>> client = os.Client()
           >>> client.login(alias='profile_2')
         """
+        if user_token is not None or user_name is None:
+            # the user of a token login is only known once the user details are
+            # received, a user name left from an earlier login must not be used
+            # to find the cached account list
+            self.__user_name = None
         if user_token is None:
             auth_token = self._setup_credentials(
                 alias=alias, user_name=user_name, password=password
@@ -755,46 +910,85 @@ class Client(object):
         else:
             raise ValueError("Login Credentials invalid")
 
-        if self.__user_name is None:
-            user = RestApi.user_details()
-            self.__user_name = user.cognito_email
+        response = None
+        if self.__current_account_id is None:
+            self.__account_cache_file = self._account_cache_file(self.__user_name)
+            response = self._load_cached_account_list(self.__account_cache_file)
+
+        # the user details and account list requests are independent so are
+        # made concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            user_future = None
+            if self.__user_name is None:
+                user_future = executor.submit(RestApi.user_details)
+            account_future = None
+            if self.__current_account_id is None and response is None:
+                account_future = executor.submit(RestApi.account_list)
+
+            if user_future is not None:
+                user = user_future.result()
+                self.__user_name = user.cognito_email
 
         if self.__current_account_id is None:
-            try:
-                response = RestApi.account_list()
-            except rest_api.ApiError as e:
-                print(f"APIError raised - {str(e)}")
-                return
+            if account_future is not None:
+                try:
+                    response = account_future.result()
+                except rest_api.ApiError as e:
+                    print(f"APIError raised - {str(e)}")
+                    self._invalidate_cached_id_token()
+                    self._invalidate_cached_account_list()
+                    return
+                if self.__account_cache_file is None:
+                    # the user may only be known once the user details are received
+                    self.__account_cache_file = self._account_cache_file(
+                        self.__user_name
+                    )
+                self._store_cached_account_list(self.__account_cache_file, response)
 
             for obj in response:
                 if obj.account is not None:
                     acc = Account(account_data=obj.account)
-                    self.account_list[acc.account_name] = acc
+                    self.__account_list[acc.account_name] = acc
+                    self.__account_by_id[acc.account_id] = acc
+
+            if self.__prefetch_hpc:
+                self._prefetch_hpc_lists()
 
             # if name or id is specifed use it otherwise default to first in list
             if account_name is not None or account_id is not None:
                 self.set_current_account(account_name, account_id)
             else:
+                first_account_id = next(iter(self.__account_by_id), None)
                 if alias is not None or user_name is None:
                     config_account = get_config_account_name(alias)
                     if config_account is None:
-                        self._set_current_account_by_id(
-                            list(self.account_list.values())[0].account_id
-                        )
+                        self._set_current_account_by_id(first_account_id)
                     elif is_uuid(config_account):
                         self._set_current_account_by_id(config_account)
                     else:
                         self._set_current_account_by_name(config_account)
                 else:
-                    self._set_current_account_by_id(
-                        list(self.account_list.values())[0].account_id
-                    )
+                    self._set_current_account_by_id(first_account_id)
 
         if not ClientSettings.getInstance().quiet_mode:
             print(
                 f"* Logged in to OnScale platform using account '{self.current_account_name}'"
             )
 
+    def close(self):
+        """Closes the network connections held open to the OnScale cloud portal
+
+        Connections are kept alive between requests, this releases them once
+        the client is no longer required. The client can still be used after
+        being closed.
+
+        Example:
+          >>> import onscale_client as os
+          >>> client = os.Client()
+          >>> client.close()
+        """
+        RestApi.close()
+
     def _get_cognito_id_token(self, user_name: str, password: str) -> str:
         """requests the cognito id token for the give nuser
         Args:
@@ -813,6 +1007,11 @@ class Client(object):
         if self.__id_token is not None:
             return self.__id_token
         else:
+            # imported here as boto3 and botocore are slow to import and are only
+            # needed when logging in with a user name and password
+            import botocore.errorfactory  # type: ignore
+            from onscale_client.auth.cognito import Cognito
+
             try:
                 cognito = Cognito(
                     user_pool_id=self.__pool_id,
@@ -830,17 +1029,236 @@ class Client(object):
                     f"ConnectionError: \
 error in user_name or password or client_pools - {ce}"
                 )
-            except TypeError:
-                raise
-            except SyntaxError:
-                raise
-            except NotImplementedError:
-                raise
-            except RuntimeError:
-                raise
 
         return ""
 
+    def _id_token_cache_file(self, user_name: str) -> Optional[str]:
+        """Returns the path of the file used to cache the id token for a user
+
+        The file is kept in the private cache directory and is named from a hash
+        of the user name and portal. None is returned if there is no private
+        cache directory available.
+        """
+        cache_dir = _private_cache_dir()
+        if cache_dir is None:
+            return None
+        key = hashlib.sha256(
+            "\n".join((user_name, self.__portal_target)).encode("utf-8")
+        ).hexdigest()
+        return os.path.join(cache_dir, f"token_{key}.json")
+
+    def _load_cached_id_token(self, password: str) -> Optional[str]:
+        """Returns the cached id token for this login if it exists, has not
+        expired and was requested with the same password
+
+        Tokens already seen by this process are returned from memory, otherwise
+        the cache file is read.
+
+        Args:
+            password: The password of this login
+
+        Returns:
+            The cached id token or None if no valid token is cached
+        """
+        key = self.__id_token_key
+        if key is None:
+            return None
+        cached = _ID_TOKEN_CACHE.get(key)
+        if cached is None:
+            cache_file = self.__id_token_cache_file
+            if cache_file is None:
+                return None
+            try:
+                _, token_data = Client._read_private_json_file(cache_file)
+                id_token = token_data["id_token"]
+                expiry = jwt.get_unverified_claims(id_token)["exp"]
+                salt = bytes.fromhex(token_data["salt"])
+                verifier = bytes.fromhex(token_data["verifier"])
+            except (OSError, ValueError, KeyError, TypeError, JWTError):
+                return None
+            cached = _ID_TOKEN_CACHE[key] = (id_token, expiry, salt, verifier)
+
+        id_token, expiry, salt, verifier = cached
+        if expiry - time.time() <= ID_TOKEN_EXPIRY_MARGIN_SECONDS:
+            _ID_TOKEN_CACHE.pop(key, None)
+            return None
+        if not hmac.compare_digest(verifier, _password_verifier(password, salt)):
+            return None
+        return id_token
+
+    def _store_cached_id_token(self, id_token: str, password: str):
+        """Caches the id token for this login in memory and in the cache file,
+        readable by the current user only
+
+        Args:
+            id_token: The id token to cache
+            password: The password the id token was requested with
+        """
+        key = self.__id_token_key
+        if key is None or not id_token:
+            return
+        salt = os.urandom(16)
+        verifier = _password_verifier(password, salt)
+        try:
+            _ID_TOKEN_CACHE[key] = (
+                id_token,
+                jwt.get_unverified_claims(id_token)["exp"],
+                salt,
+                verifier,
+            )
+        except (KeyError, JWTError):
+            pass
+        if self.__id_token_cache_file is not None:
+            Client._write_private_json_file(
+                self.__id_token_cache_file,
+                {"id_token": id_token, "salt": salt.hex(), "verifier": verifier.hex()},
+            )
+
+    def _invalidate_cached_id_token(self):
+        """Removes the cached id token used for this login, if any"""
+        if self.__id_token_key is not None:
+            _ID_TOKEN_CACHE.pop(self.__id_token_key, None)
+            self.__id_token_key = None
+        if self.__id_token_cache_file is not None:
+            try:
+                os.remove(self.__id_token_cache_file)
+            except OSError:
+                pass
+            self.__id_token_cache_file = None
+
+    def _account_cache_file(self, user_name: Optional[str]) -> Optional[str]:
+        """Returns the path of the file used to cache the account list for a user
+
+        The file is kept in the private cache directory and is named from a hash
+        of the user name and portal. None is returned if the user is not known or
+        there is no private cache directory available.
+        """
+        if user_name is None:
+            return None
+        cache_dir = _private_cache_dir()
+        if cache_dir is None:
+            return None
+        key = hashlib.sha256(
+            "\n".join((user_name, self.__portal_target)).encode("utf-8")
+        ).hexdigest()
+        return os.path.join(cache_dir, f"accounts_{key}.json")
+
+    @staticmethod
+    def _load_cached_account_list(
+        cache_file: Optional[str],
+    ) -> Optional[List[datamodel.AccountListResponse]]:
+        """Returns the cached account list if it exists and is recent enough
+
+        Args:
+            cache_file: The path of the account list cache file
+
+        Returns:
+            The cached account list or None if no valid account list is cached
+        """
+        if cache_file is None:
+            return None
+        try:
+            modified_time, cached_list = Client._read_private_json_file(cache_file)
+            if time.time() - modified_time > ACCOUNT_CACHE_TTL_SECONDS:
+                return None
+            return [datamodel.AccountListResponse(**obj) for obj in cached_list]
+        except (OSError, ValueError, TypeError):
+            return None
+
+    @staticmethod
+    def _store_cached_account_list(
+        cache_file: Optional[str], account_list: List[datamodel.AccountListResponse]
+    ):
+        """Writes the account list to the cache file, readable by the current user
+        only
+
+        Args:
+            cache_file: The path of the account list cache file
+            account_list: The account list response to cache
+        """
+        if cache_file is None:
+            return
+        Client._write_private_json_file(
+            cache_file,
+            [
+                json.loads(obj.json(by_alias=True, exclude_none=True))
+                for obj in account_list
+            ],
+        )
+
+    def _invalidate_cached_account_list(self):
+        """Removes the cached account list used for this login, if any"""
+        if self.__account_cache_file is None:
+            return
+        try:
+            os.remove(self.__account_cache_file)
+        except OSError:
+            pass
+        self.__account_cache_file = None
+
+    def _on_account_api_error(self, e: rest_api.ApiError):
+        """Discards the cached account list if an account scoped request was
+        refused, as the user may no longer have access to the account
+
+        Args:
+            e: The error raised by the request
+        """
+        if _api_error_status(e) in (401, 403):
+            self._invalidate_cached_account_list()
+
+    @staticmethod
+    def _read_private_json_file(file_path: str) -> Tuple[float, Any]:
+        """Reads json data from file_path, which must be a regular file owned by
+        and readable by the current user only
+
+        Args:
+            file_path: The path of the file to read
+
+        Returns:
+            The modification time of the file and the data read from it
+
+        Raises:
+            OSError: the file cannot be read or is not private to the current user
+            ValueError: the file does not contain valid json
+        """
+        fd = os.open(file_path, os.O_RDONLY | _O_NOFOLLOW)
+        with os.fdopen(fd, "r") as json_file:
+            file_stat = os.fstat(fd)
+            if (
+                not stat.S_ISREG(file_stat.st_mode)
+                or not _owned_by_current_user(file_stat)
+                or file_stat.st_mode & 0o077
+            ):
+                raise PermissionError(f"{file_path} is not private to the user")
+            return file_stat.st_mtime, json.load(json_file)
+
+    @staticmethod
+    def _write_private_json_file(file_path: str, data):
+        """Writes data as json to file_path, creating the file readable by the
+        current user only
+
+        The data is written to a new file which then replaces file_path, so an
+        existing file or link at file_path is never written through.
+
+        Args:
+            file_path: The path of the file to write
+            data: The json serializable data to write
+        """
+        try:
+            fd, temp_path = tempfile.mkstemp(
+                dir=os.path.dirname(file_path), prefix=".tmp_", suffix=".json"
+            )
+            try:
+                with os.fdopen(fd, "w") as json_file:
+                    json.dump(data, json_file)
+                os.replace(temp_path, file_path)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            if ClientSettings.getInstance().debug_mode:
+                print(f"Unable to write cache file {file_path}")
+
     def _get_developer_token(self, alias: str = None) -> str:
         """Returns the developer token if one exists for the alias specified. Will
         check for the credentials within the config file if no token exists.
@@ -871,7 +1289,8 @@ error in user_name or password or client_pools - {ce}"
         if self.__id_token is None:
             raise ValueError("invalid login credentials")
 
-        if ClientSettings.getInstance().debug_mode:
+        settings = ClientSettings.getInstance()
+        if settings.debug_mode:
             print("requesting token")
 
         try:
@@ -885,7 +1304,7 @@ error in user_name or password or client_pools - {ce}"
             raise e
 
         if is_dev_token(token):
-            if ClientSettings.getInstance().debug_mode:
+            if settings.debug_mode:
                 print("generating onscale credentials")
             self.__dev_token = str(token)
             return self.__dev_token
@@ -895,53 +1314,27 @@ error in user_name or password or client_pools - {ce}"
     def remove_developer_tokens(self):
         """Remove the developer tokens for the current logged in user"""
 
-        user_dir = os.path.expanduser(f"~{getpass.getuser()}")
-        onscale_dir = os.path.join(user_dir, ".onscale")
-        config_file = os.path.join(onscale_dir, "config")
-
-        if ClientSettings.getInstance().debug_mode:
+        settings = ClientSettings.getInstance()
+        if settings.debug_mode:
             print("* removing dev token")
 
         try:
             create_date_list = RestApi.user_token_list()
 
-            for date in create_date_list:
-                token = RestApi.delete_user_token(date)
-
-                if os.path.exists(config_file):
-                    with open(config_file, "r") as json_config:
-                        config_data = json.load(json_config)
-                    default_data = config_data["default"]
-                    if isinstance(default_data, str):
-                        default = config_data["profiles"][default_data]
-                    else:
-                        default = default_data
-                    default_config_token = str(default["token"])
-
-                    temp_profiles = copy.copy(config_data["profiles"])
-
-                    for key, profile in config_data["profiles"].items():
-                        profile_token = str(profile["token"])
-                        if token in profile_token:
-                            del temp_profiles[key]
-                    config_data["profiles"] = temp_profiles
-
-                    # if default profile has been removed then change to the
-                    # first in the profiles list
-                    if token in default_config_token:
-                        if temp_profiles:
-                            config_data["default"] = list(temp_profiles.keys())[0]
-                        else:
-                            config_data["default"] = None
+            removed_tokens = list()
+            try:
+                for date in create_date_list:
+                    removed_tokens.append(RestApi.delete_user_token(date))
+                    print(f"> dev token created on {date} removed")
 
-                    with open(config_file, "w") as json_config:
-                        json.dump(config_data, json_config, indent=4)
-                print(f"> dev token created on {date} removed")
+                    if settings.debug_mode:
+                        print("DEBUG - clearing dev token attribute")
 
-                if ClientSettings.getInstance().debug_mode:
-                    print("DEBUG - clearing dev token attribute")
-
-                self.__dev_token = None
+                    self.__dev_token = None
+            finally:
+                # update the config once, including when a later delete request
+                # fails, so it never refers to tokens which no longer exist
+                remove_token_profiles(removed_tokens)
 
         except rest_api.ApiError as e:
             print(f"APIError raised - {str(e)}")
@@ -1038,18 +1431,21 @@ error in user_name or password or client_pools - {ce}"
         if not isinstance(sim_materials, dict):
             raise TypeError("TypeError : sim_materials is not a dict value")
 
-        cad_meta_dict = dict()
-        for idx, cf in enumerate(cad_files):
-            cad_meta_dict[os.path.basename(cf)] = cad_blob_ids[idx]
-
-        mesh_meta_dict = dict()
-        for idx, cf in enumerate(mesh_files):
-            mesh_meta_dict[os.path.basename(cf)] = mesh_blob_ids[idx]
-
+        # the file and blob id lists have been checked to be of equal length
+        cad_meta_dict = {
+            os.path.basename(cf): blob_id
+            for cf, blob_id in zip(cad_files, cad_blob_ids)
+        }
+        mesh_meta_dict = {
+            os.path.basename(cf): blob_id
+            for cf, blob_id in zip(mesh_files, mesh_blob_ids)
+        }
         mat_meta_dict = dict()
         if material_files is not None and material_blob_ids is not None:
-            for idx, mf in enumerate(material_files):
-                mat_meta_dict[os.path.basename(mf)] = material_blob_ids[idx]
+            mat_meta_dict = {
+                os.path.basename(mf): blob_id
+                for mf, blob_id in zip(material_files, material_blob_ids)
+            }
 
         linked_job_map = dict()
         if linked_job_files:
@@ -1384,7 +1780,7 @@ error in user_name or password or client_pools - {ce}"
                 else:
                     basename = "local_material_map.json"
                 temp_db = os.path.join(TEMP_DIR, basename)
-                copyfile(path, temp_db)
+                shutil.copyfile(path, temp_db)
                 return temp_db
             else:
                 return path
@@ -1642,7 +2038,7 @@ error in user_name or password or client_pools - {ce}"
         def linked_file_check(file, linked_files):
             if linked_files:
                 for f in linked_files:
-                    if c == f.file_alias:
+                    if file == f.file_alias:
                         return True
             return False
 
@@ -1658,30 +2054,28 @@ error in user_name or password or client_pools - {ce}"
             design_goal=f"{cad_name} workflow",
         )
 
-        cad_blob_ids = list()
-        for c in cad_files:
-            if c is not None:
-                if linked_file_check(c, linked_files):
-                    continue
-                cad_blob_id = job.upload_blob(
-                    blob_type=datamodel.BlobType.CAD, file_name=c
-                )
-                cad_blob_ids.append(cad_blob_id)
+        cad_blob_ids = job.upload_blobs(
+            blob_type=datamodel.BlobType.CAD,
+            file_names=[
+                c
+                for c in cad_files
+                if c is not None and not linked_file_check(c, linked_files)
+            ],
+        )
         for blob_id in cad_blob_ids:
             print(f"Waiting for CAD conversion for blob {blob_id}...")
             wait_for_child_blob(
                 parent_blob_id=blob_id, blob_type="CADMETADATA", timeout_secs=60 * 60
             )
 
-        material_file_ids: List[str] = list()
-        for mm in material_files:
-            if mm is not None:
-                if linked_file_check(mm, linked_files):
-                    continue
-                mat_blob_id = job.upload_blob(
-                    blob_type=datamodel.BlobType.MATERIAL, file_name=mm
-                )
-                material_file_ids.append(mat_blob_id)
+        material_file_ids = job.upload_blobs(
+            blob_type=datamodel.BlobType.MATERIAL,
+            file_names=[
+                mm
+                for mm in material_files
+                if mm is not None and not linked_file_check(mm, linked_files)
+            ],
+        )
 
         # Wait for meshing to finish
         wait_for_blob(blob_type="MESHAUTO",
@@ -2270,6 +2664,7 @@ Connection has not been established"
                 )
         except rest_api.ApiError as e:
             print(f"APIError raised - {str(e)}")
+            self._on_account_api_error(e)
 
         for j in job_list:
             job = Job(
@@ -2358,6 +2753,7 @@ An account id has not been established for the current user."
             )
         except rest_api.ApiError as e:
             print(f"APIError raised - {str(e)}")
+            self._on_account_api_error(e)
             return None
 
         if job_list_response:
@@ -2419,6 +2815,7 @@ An account id has not been established for the current user."
                 )
         except rest_api.ApiError as e:
             print(f"APIError raised - {str(e)}")
+            self._on_account_api_error(e)
             return
 
         for j in job_list:
@@ -2434,6 +2831,9 @@ An account id has not been established for the current user."
     def get_available_materials(self):
         """Return the list of available materials for the current account
 
+        The list is cached per account for MATERIAL_CACHE_TTL_SECONDS so that
+        repeated submissions do not each request it again.
+
         Returns:
             The list of materials available to the logged in account
         """
@@ -2443,12 +2843,21 @@ An account id has not been established for the current user."
 Connection has not been established"
             )
 
+        account_id = self.current_account_id
+        cached = self.__material_cache.get(account_id)
+        if cached is not None:
+            fetch_time, materials_list = cached
+            if time.monotonic() - fetch_time < MATERIAL_CACHE_TTL_SECONDS:
+                return list(materials_list)
+
         try:
-            materials_list = RestApi.material_list(self.current_account_id)
+            materials_list = RestApi.material_list(account_id)
         except rest_api.ApiError as e:
             print(f"APIError raised - {str(e)}")
+            self._on_account_api_error(e)
             return
-        return materials_list
+        self.__material_cache[account_id] = (time.monotonic(), materials_list)
+        return list(materials_list)
 
     def _get_simulation_material_mapping(self, materials_list: list, input_file: str):
         """Returns a dictionary with the material name mapped to the material UUID
@@ -2607,6 +3016,8 @@ Connection has not been established"
             design_instance_id: The desired design instance id
             download_dir: The directory to download to
         """
+        settings = ClientSettings.getInstance()
+
         # get the simulation blobs
         sim_blobs = self._get_latest_blobs_by_type(
             design_instance_id, datamodel.BlobType.SIMAPI
@@ -2624,10 +3035,7 @@ Connection has not been established"
 
         # exit out if we dont have sim metadata
         if not isinstance(simmeta_blob, datamodel.Blob):
-            if (
-                not ClientSettings.getInstance().quiet_mode
-                or ClientSettings.getInstance().debug_mode
-            ):
+            if not settings.quiet_mode or settings.debug_mode:
                 print(f"sim meta data blob does not exist for {design_instance_id}")
             return
 
@@ -2657,7 +3065,7 @@ Connection has not been established"
                     for c in child_blobs:
                         dl_blobs.append(c)
                 except rest_api.ApiError as e:
-                    if ClientSettings.getInstance().debug_mode:
+                    if settings.debug_mode:
                         print(f"child blobs do not exist for {b.blob_id}")
                         print(f"ApiError raised - {str(e)}")
                     continue
@@ -2849,8 +3257,7 @@ Connection has not been established"
                 print(f"APIError raised - {str(e)}")
             return
 
-        user_dir = os.path.expanduser(f"~{getpass.getuser()}")
-        paraview_dir = os.path.join(user_dir, ".onscale", "paraview")
+        paraview_dir = os.path.join(get_onscale_dir(), "paraview")
         file_path = os.path.join(paraview_dir, f"id_{job_id}")
 
         try:
@@ -2916,7 +3323,9 @@ Connection has not been established"
             return
 
     @staticmethod
-    def _input_from_operation(operation: str) -> str:
+    def _input_from_operation(
+        operation: Optional[Union[str, datamodel.Operation]]
+    ) -> str:
         """Returns the input file extension for a given operation
 
             Static helper method to return the input file extension for
@@ -2925,6 +3334,9 @@ Connection has not been established"
                 .flxinp : SIMULATION
                 .bldinp : BUILD
                 .revinp : REVIEW
+
+        Args:
+            operation: The operation string or datamodel.Operation member.
         Raises:
             RuntimeError: raised if the operation is invalid
 
@@ -2936,18 +3348,6 @@ Connection has not been established"
             >>> print(os.Job._input_extension_from_operation(operation='REFLEX_MPI))
             '.json'
         """
-        if operation is not None:
-            if "REFLEX" in operation:
-                return ".json"
-            elif "MOEBIUS" in operation:
-                return ".py"
-            elif "OPENFOAM" in operation:
-                return ".json"
-            elif "BUILD" in operation:
-                return ".bldinp"
-            elif "REVIEW" in operation:
-                return ".revinp"
-            else:
-                return ".flxinp"
-
-        return ""
+        if operation is None:
+            return ""
+        return _input_extension_from_operation(operation)
@@ -1,3 +1,3 @@
 from .client_pools import ClientDevelopmentPools, ClientProductionPools, ClientTestPools
-from .client_pools import PortalHost, PortalTarget
+from .client_pools import PortalHost, PortalTarget, PORTAL_TARGETS, PORTAL_CANONICAL
 from .client_settings import ClientSettings, TEMP_DIR
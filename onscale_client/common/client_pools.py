@@ -11,6 +11,19 @@ class PortalTarget(Enum):
     LIST = ["test", "dev", "development", "prod", "production"]
 
 
+""" the accepted portal target names, for constant time membership checks """
+PORTAL_TARGETS = frozenset(PortalTarget.LIST.value)
+
+""" maps each accepted portal target name to the portal target value it refers to """
+PORTAL_CANONICAL = {
+    "test": PortalTarget.Test.value,
+    "dev": PortalTarget.Development.value,
+    "development": PortalTarget.Development.value,
+    "prod": PortalTarget.Production.value,
+    "production": PortalTarget.Production.value,
+}
+
+
 @unique
 class PortalHost(Enum):
     """NOTE: all the urls the user may login to."""
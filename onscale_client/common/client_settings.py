@@ -1,5 +1,7 @@
 # flake8: noqa
+import functools
 import tempfile
+import threading
 import os
 
 
@@ -7,7 +9,10 @@ import os
 TEMP_DIR = f"{tempfile.gettempdir()}{os.path.sep}onscale_client"
 
 
+@functools.lru_cache(maxsize=None)
 def is_jupyter() -> bool:
+    # the kernel type cannot change within a process so this is only
+    # determined once
     try:
         from IPython import get_ipython  # type: ignore
         from ipykernel.zmqshell import ZMQInteractiveShell  # type: ignore
@@ -31,24 +36,45 @@ def import_tqdm_notebook() -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=None)
+def get_tqdm():
+    """Returns the tqdm progress bar class to use, importing it on first use
+
+    The notebook progress bar is used when running within jupyter with ipywidgets
+    available, so the import is deferred until a progress bar is needed.
+    """
+    if import_tqdm_notebook():
+        from tqdm.notebook import tqdm  # type: ignore
+    else:
+        from tqdm import tqdm  # type: ignore
+    return tqdm
+
+
+""" guards creation of the ClientSettings instance """
+_INSTANCE_LOCK = threading.Lock()
+
+
 class ClientSettings:
     __instance = None
 
     @staticmethod
     def getInstance():
         """Static access method."""
-        if ClientSettings.__instance is None:
+        instance = ClientSettings.__instance
+        if instance is None:
             ClientSettings()
-        return ClientSettings.__instance
+            instance = ClientSettings.__instance
+        return instance
 
     def __init__(self, quiet_mode: bool = False, debug_mode: bool = False):
         """Virtually private constructor."""
-        if ClientSettings.__instance is not None:
-            pass
-        else:
-            self.quiet_mode = quiet_mode
-            self.debug_mode = debug_mode
+        with _INSTANCE_LOCK:
+            if ClientSettings.__instance is not None:
+                pass
+            else:
+                self.quiet_mode = quiet_mode
+                self.debug_mode = debug_mode
 
-            self.is_jupyter = is_jupyter()
+                self.is_jupyter = is_jupyter()
 
-            ClientSettings.__instance = self
+                ClientSettings.__instance = self
@@ -7,32 +7,44 @@ DEV_TOKEN_PATTERN = re.compile(
     r"[0-9a-fA-F]{12}_[0-9]{13}_[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-"
     r"[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
 )
+_match_dev_token = DEV_TOKEN_PATTERN.match
+
+""" length of a canonical UUID string and of the tokens built from them. These
+are checked before matching so that most invalid strings avoid the regex """
+UUID_LENGTH = 36
+DEV_TOKEN_LENGTH = UUID_LENGTH + 1 + 13 + 1 + UUID_LENGTH
+SUPERVISOR_TOKEN_LENGTH = UUID_LENGTH + 1 + UUID_LENGTH
 
 
 def is_dev_token(token: str) -> bool:
     """Check if a token string is a valid developer token."""
-    return bool(DEV_TOKEN_PATTERN.match(token))
+    return len(token) == DEV_TOKEN_LENGTH and _match_dev_token(token) is not None
 
 
 SUPERVISOR_TOKEN_PATTERN = re.compile(
     r"^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}_"
     r"[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$"
 )
+_match_supervisor_token = SUPERVISOR_TOKEN_PATTERN.match
 
 
 def is_supervisor_token(token: str) -> bool:
     """Check if a token string is a valid supervisor token."""
-    return bool(SUPERVISOR_TOKEN_PATTERN.match(token))
+    return (
+        len(token) == SUPERVISOR_TOKEN_LENGTH
+        and _match_supervisor_token(token) is not None
+    )
 
 
 UUID_PATTERN = re.compile(
-    r"^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$"
+    r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
 )
+_match_uuid = UUID_PATTERN.match
 
 
 def is_uuid(token: str) -> bool:
-    """Check if a token string is a valid supervisor token."""
-    return bool(UUID_PATTERN.match(token))
+    """Check if a token string is a UUID in canonical form, of any version."""
+    return len(token) == UUID_LENGTH and _match_uuid(token) is not None
 
 
 OS_DEFAULT_PROFILE = os.getenv("ONSCALE_DEFAULT_PROFILE")
@@ -1,15 +1,57 @@
 import os
+import copy
 import getpass
 import json
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from onscale_client.api.rest_api import ApiError
 
-from .common.client_pools import PortalTarget
+from .common.client_pools import PortalTarget, PORTAL_CANONICAL, PORTAL_TARGETS
 from .common.misc import is_dev_token, is_supervisor_token, OS_DEFAULT_PROFILE
 
 
+""" location of the user's onscale config, resolved once on import """
+_ONSCALE_DIR = os.path.join(os.path.expanduser("~"), ".onscale")
+_CONFIG_FILE = os.path.join(_ONSCALE_DIR, "config")
+
+""" parsed config files keyed by path, each stored with the (st_mtime_ns, st_size)
+of the file at the time it was read """
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], dict]] = {}
+
+
+def _load_config(config_file: str) -> dict:
+    """Returns the parsed contents of config_file
+
+    The parsed data is cached and only re-read when the file has changed on
+    disk. The returned dict is shared, callers intending to modify it must
+    take a copy.
+    """
+    stat = os.stat(config_file)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _CONFIG_CACHE.get(config_file)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    with open(config_file, "r") as json_config:
+        config_data = json.load(json_config)
+    _CONFIG_CACHE[config_file] = (key, config_data)
+    return config_data
+
+
+def _write_config(config_file: str, config_data: dict):
+    """Writes config_data to config_file and clears the cached config data
+
+    The data is serialised before the file is opened so that it is written in
+    a single call and a value which cannot be serialised leaves the existing
+    file intact.
+    """
+    config_json = json.dumps(config_data, indent=4)
+    with open(config_file, "w") as json_config:
+        json_config.write(config_json)
+    invalidate_config_cache()
+
+
 class ConfigOptions:
     """Configuration Options"""
 
@@ -49,17 +91,11 @@ def configure(
         >>> import onscale_client as os
         >>> os.configure()
     """
-    user_dir = os.path.expanduser(f"~{getpass.getuser()}")
-    onscale_dir = os.path.join(user_dir, ".onscale")
-    config_file = os.path.join(onscale_dir, "config")
-
     try:
-        if os.path.exists(config_file):
-            with open(config_file) as json_config:
-                config_data = json.load(json_config)
-        else:
-            if not os.path.exists(onscale_dir):
-                os.makedirs(onscale_dir)
+        try:
+            config_data = copy.deepcopy(_load_config(_CONFIG_FILE))
+        except FileNotFoundError:
+            os.makedirs(_ONSCALE_DIR, exist_ok=True)
             config_data = dict()
             config_data["profiles"] = dict()
 
@@ -79,12 +115,9 @@ def configure(
             password = getpass.getpass()
 
         if user_name is not None and password is not None:
-            if portal_target not in PortalTarget.LIST.value:
+            if portal_target not in PORTAL_TARGETS:
                 raise ValueError("specified portal is invalid")
-            if portal_target == "develoment":
-                portal_target = "dev"
-            if portal_target == "production":
-                portal_target = "prod"
+            portal_target = PORTAL_CANONICAL[portal_target]
 
             # local import to prevent circular dependency
             from .client import Client
@@ -124,14 +157,13 @@ def configure(
                     ] = options.__dict__
                     config_data["default"] = f"{portal_target}_profile"
 
-                with open(config_file, "w") as json_config:
-                    json.dump(config_data, json_config, indent=4)
+                _write_config(_CONFIG_FILE, config_data)
             else:
                 raise ValueError("configuration failed for login details")
         else:
             raise ValueError("configuration failed for login details")
     except json.JSONDecodeError:
-        print(f"Error reading {config_file}")
+        print(f"Error reading {_CONFIG_FILE}")
         return
     except ValueError as e:
         print("Value Error :", e)
@@ -160,17 +192,11 @@ def import_token(
 
 
     """
-    user_dir = os.path.expanduser(f"~{getpass.getuser()}")
-    onscale_dir = os.path.join(user_dir, ".onscale")
-    config_file = os.path.join(onscale_dir, "config")
-
     try:
-        if os.path.exists(config_file):
-            with open(config_file) as json_config:
-                config_data = json.load(json_config)
-        else:
-            if not os.path.exists(onscale_dir):
-                os.makedirs(onscale_dir)
+        try:
+            config_data = copy.deepcopy(_load_config(_CONFIG_FILE))
+        except FileNotFoundError:
+            os.makedirs(_ONSCALE_DIR, exist_ok=True)
             config_data = dict()
 
         if alias is None:
@@ -184,12 +210,9 @@ def import_token(
                     print(f"Error - Alias [{alias}] already exists")
                     return
 
-        if portal_target not in PortalTarget.LIST.value:
+        if portal_target not in PORTAL_TARGETS:
             raise ValueError("specified portal is invalid")
-        if portal_target == "develoment":
-            portal_target = "dev"
-        if portal_target == "production":
-            portal_target = "prod"
+        portal_target = PORTAL_CANONICAL[portal_target]
 
         # local import to prevent circular dependency
         from .client import Client
@@ -224,13 +247,12 @@ def import_token(
                 config_data["profiles"][f"{portal_target}_profile"] = options.__dict__
                 config_data["default"] = f"{portal_target}_profile"
 
-            with open(config_file, "w") as json_config:
-                json.dump(config_data, json_config, indent=4)
+            _write_config(_CONFIG_FILE, config_data)
         else:
             raise ValueError("No user associsated with auth token")
 
     except json.JSONDecodeError:
-        print(f"Error reading {config_file}")
+        print(f"Error reading {_CONFIG_FILE}")
         return
     except ValueError as e:
         print("Value Error :", e)
@@ -251,12 +273,9 @@ def clear_profiles():
         password = getpass.getpass()
 
         if user_name is not None and password is not None:
-            if portal_target not in PortalTarget.LIST.value:
+            if portal_target not in PORTAL_TARGETS:
                 raise ValueError("specified portal is invalid")
-            if portal_target == "develoment":
-                portal_target = "dev"
-            if portal_target == "production":
-                portal_target = "prod"
+            portal_target = PORTAL_CANONICAL[portal_target]
 
             # local import to prevent circular dependency
             from .client import Client
@@ -292,12 +311,8 @@ def switch_default_profile(alias: str):
         if alias == "default":
             return
         if alias is not None:
-            user_dir = os.path.expanduser(f"~{getpass.getuser()}")
-            onscale_dir = os.path.join(user_dir, ".onscale")
-            config_file = os.path.join(onscale_dir, "config")
-            if os.path.exists(config_file):
-                with open(config_file, "r") as json_config:
-                    config_data = json.load(json_config)
+            if os.path.exists(_CONFIG_FILE):
+                config_data = copy.deepcopy(_load_config(_CONFIG_FILE))
 
                 if "profiles" not in config_data:
                     raise ValueError("alias does not exist")
@@ -306,12 +321,11 @@ def switch_default_profile(alias: str):
                 else:
                     config_data["default"] = alias
 
-                    with open(config_file, "w") as json_config:
-                        json.dump(config_data, json_config, indent=4)
+                    _write_config(_CONFIG_FILE, config_data)
             else:
                 raise ValueError("user profiles have not been defined")
     except json.JSONDecodeError:
-        print(f"Error reading {config_file}")
+        print(f"Error reading {_CONFIG_FILE}")
         raise
         return
     except ValueError as e:
@@ -320,6 +334,64 @@ def switch_default_profile(alias: str):
         return
 
 
+def remove_token_profiles(tokens: Iterable[str]):
+    """Removes the profiles using any of the given developer tokens from the
+    config file
+
+    The config file is written once for all of the tokens. If the default
+    profile is removed the first remaining profile becomes the default.
+
+    Args:
+        tokens: The developer tokens whose profiles should be removed
+    """
+    tokens = set(tokens)
+    if not tokens or not os.path.exists(_CONFIG_FILE):
+        return
+
+    try:
+        config_data = copy.deepcopy(_load_config(_CONFIG_FILE))
+    except json.JSONDecodeError:
+        print(f"Error reading {_CONFIG_FILE}")
+        return
+
+    profiles = config_data.get("profiles", {})
+    removed_keys = [k for k, p in profiles.items() if str(p["token"]) in tokens]
+    if not removed_keys:
+        return
+    for key in removed_keys:
+        del profiles[key]
+
+    # if default profile has been removed then change to the first in the
+    # profiles list
+    default_data = config_data.get("default")
+    if isinstance(default_data, str):
+        default_removed = default_data not in profiles
+    else:
+        default_removed = (
+            default_data is not None and str(default_data["token"]) in tokens
+        )
+    if default_removed:
+        config_data["default"] = next(iter(profiles), None)
+
+    _write_config(_CONFIG_FILE, config_data)
+
+
+def get_onscale_dir() -> str:
+    """Returns the path of the user's onscale directory, which holds the config
+    file and other per user data"""
+    return _ONSCALE_DIR
+
+
+def invalidate_config_cache():
+    """Clears the cached config file data
+
+    The cache is validated against the modification time of the config file,
+    this should still be called whenever the config file is written so that
+    subsequent lookups can never see stale values.
+    """
+    _CONFIG_CACHE.clear()
+
+
 def get_available_profiles(portal_target: Optional[str] = None) -> List[str]:
     """Returns the available profiles defined within the config file
 
@@ -332,29 +404,19 @@ def get_available_profiles(portal_target: Optional[str] = None) -> List[str]:
         >>> print(client.get_available_profiles())
         ['profile_1', 'test_profile']
     """
-    user_dir = os.path.expanduser(f"~{getpass.getuser()}")
-    onscale_dir = os.path.join(user_dir, ".onscale")
-    config_file = os.path.join(onscale_dir, "config")
-
     try:
-        if os.path.exists(config_file):
-            with open(config_file, "r") as json_config:
-                config_data = json.load(json_config)
-
-            return_list = list()
-            for k in config_data["profiles"].keys():
-                if portal_target is not None:
-                    profile = config_data["profiles"][k]
-                    if profile["portal"] == portal_target:
-                        return_list.append(k)
-                else:
-                    return_list.append(k)
-            return return_list
+        if os.path.exists(_CONFIG_FILE):
+            config_data = _load_config(_CONFIG_FILE)
+
+            profiles = config_data.get("profiles", {})
+            if portal_target is None:
+                return list(profiles)
+            return [k for k, p in profiles.items() if p.get("portal") == portal_target]
         else:
             print("User profiles not defined.")
 
     except json.JSONDecodeError:
-        print(f"Error reading {config_file}")
+        print(f"Error reading {_CONFIG_FILE}")
 
     return list()
 
@@ -373,14 +435,9 @@ def get_config_portal(alias: str = None) -> str:
         if OS_DEFAULT_PROFILE in get_available_profiles():
             alias = OS_DEFAULT_PROFILE
 
-    user_dir = os.path.expanduser(f"~{getpass.getuser()}")
-    onscale_dir = os.path.join(user_dir, ".onscale")
-    config_file = os.path.join(onscale_dir, "config")
-
     try:
-        if os.path.exists(config_file):
-            with open(config_file, "r") as json_config:
-                config_data = json.load(json_config)
+        if os.path.exists(_CONFIG_FILE):
+            config_data = _load_config(_CONFIG_FILE)
             if alias is None:
                 profile = config_data["default"]
                 if isinstance(profile, str):
@@ -391,7 +448,7 @@ def get_config_portal(alias: str = None) -> str:
                 portal = config_data["profiles"][alias]["portal"]
             return portal
     except json.JSONDecodeError:
-        print(f"Error reading {config_file}")
+        print(f"Error reading {_CONFIG_FILE}")
 
     return ""
 
@@ -411,17 +468,13 @@ def get_config_developer_token(alias: str = None) -> str:
     Returns:
         The developer token
     """
-    user_dir = os.path.expanduser(f"~{getpass.getuser()}")
-    onscale_dir = os.path.join(user_dir, ".onscale")
-    config_file = os.path.join(onscale_dir, "config")
     try:
-        if os.path.exists(config_file):
+        if os.path.exists(_CONFIG_FILE):
             if alias is None:
                 if OS_DEFAULT_PROFILE in get_available_profiles():
                     alias = OS_DEFAULT_PROFILE
 
-            with open(config_file, "r") as json_config:
-                config_data = json.load(json_config)
+            config_data = _load_config(_CONFIG_FILE)
 
             if alias is None:
                 profile = config_data["default"]
@@ -437,7 +490,7 @@ def get_config_developer_token(alias: str = None) -> str:
             else:
                 raise ValueError(f"Invalid developer token for {alias}")
     except json.JSONDecodeError:
-        print(f"Error reading {config_file}")
+        print(f"Error reading {_CONFIG_FILE}")
 
     return ""
 
@@ -452,18 +505,13 @@ def get_config_account_name(alias: str = None) -> str:
     Returns:
         The portal identifier
     """
-    user_dir = os.path.expanduser(f"~{getpass.getuser()}")
-    onscale_dir = os.path.join(user_dir, ".onscale")
-    config_file = os.path.join(onscale_dir, "config")
-
     try:
-        if os.path.exists(config_file):
+        if os.path.exists(_CONFIG_FILE):
             if alias is None:
                 if OS_DEFAULT_PROFILE in get_available_profiles():
                     alias = OS_DEFAULT_PROFILE
 
-            with open(config_file, "r") as json_config:
-                config_data = json.load(json_config)
+            config_data = _load_config(_CONFIG_FILE)
 
             if alias is None:
                 profile_data = config_data["default"]
@@ -480,6 +528,6 @@ def get_config_account_name(alias: str = None) -> str:
                 account = None
             return account
     except json.JSONDecodeError:
-        print(f"Error reading {config_file}")
+        print(f"Error reading {_CONFIG_FILE}")
 
     return ""
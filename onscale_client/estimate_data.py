@@ -1,6 +1,18 @@
 class EstimateData:
     """Data structure to store individual estimate data"""
 
+    __slots__ = (
+        "id",
+        "cores",
+        "memory",
+        "run_time",
+        "parts",
+        "hash",
+        "cost",
+        "type",
+        "parameters",
+    )
+
     def __init__(self, **kwargs):
         self.id = kwargs["id"] if "id" in kwargs else None
         self.cores = kwargs["cores"]
@@ -14,6 +26,26 @@ class EstimateData:
 
         self._validate()
 
+    @classmethod
+    def _from_row(
+        cls, id, cores, memory, run_time, parts, hash, cost, type, parameters
+    ):
+        """Creates an EstimateData from values already validated by the caller
+
+        Skips the keyword argument lookups and validation done by __init__
+        """
+        self = cls.__new__(cls)
+        self.id = id
+        self.cores = cores
+        self.memory = memory
+        self.run_time = run_time
+        self.parts = parts
+        self.hash = hash
+        self.cost = cost
+        self.type = type
+        self.parameters = parameters
+        return self
+
     def set_data(self, **kwargs):
         """Sets the Estimate data using the args passed"""
         self.id = kwargs["id"]
@@ -39,25 +71,25 @@ class EstimateData:
 
     def __str__(self):
         """string representation of EstimateData object"""
-        return_str = "EstimateData(\n"
-        return_str += f"    id={self.id},\n"
-        return_str += f"    cores={self.cores},\n"
-        return_str += f"    memory={self.memory},\n"
-        return_str += f"    run_time={self.run_time},\n"
-        return_str += f"    parts={self.parts},\n"
-        return_str += f"    hash={self.hash},\n"
-        return_str += f"    cost={self.cost},\n"
-        return_str += f"    type={self.type},\n"
-        return_str += f"    parameters={self.parameters},\n"
-        return_str += ")"
-        return return_str
+        return (
+            "EstimateData(\n"
+            f"    id={self.id},\n"
+            f"    cores={self.cores},\n"
+            f"    memory={self.memory},\n"
+            f"    run_time={self.run_time},\n"
+            f"    parts={self.parts},\n"
+            f"    hash={self.hash},\n"
+            f"    cost={self.cost},\n"
+            f"    type={self.type},\n"
+            f"    parameters={self.parameters},\n"
+            ")"
+        )
 
     def __repr__(self) -> str:
         attrs = list()
-        for k, v in self.__dict__.items():
-            if k.startswith("_"):
-                continue
-            elif v is None:
+        for k in self.__slots__:
+            v = getattr(self, k)
+            if v is None:
                 continue
             else:
                 attrs.append(f"{k}={str(v)}")
@@ -1,3 +1,5 @@
+import bisect
+
 from .estimate_data import EstimateData
 
 
@@ -5,6 +7,22 @@ class EstimateResults:
     """EstimateResults class used to store and operate on the results which are returned
     from the process of estimation."""
 
+    __slots__ = (
+        "estimate_id",
+        "number_of_cores",
+        "estimated_memory",
+        "estimated_run_times",
+        "parts_count",
+        "type",
+        "estimate_hashes",
+        "parameters",
+        "_costs",
+        "_cost_order",
+        "_sorted_costs",
+        "_mnmpi_cores",
+        "_mnmpi_parts",
+    )
+
     def __init__(self, **kwargs):
         self.estimate_id = kwargs["estimateId"]
         self.number_of_cores = kwargs["numberOfCores"]
@@ -15,22 +33,30 @@ class EstimateResults:
         self.estimate_hashes = kwargs["estimateHashes"]
         self.parameters = kwargs["parameters"]
 
+        self._costs = None
+        self._cost_order = None
+        self._sorted_costs = None
+        self._mnmpi_cores = None
+        self._mnmpi_parts = None
+
     def __str__(self):
-        return_str = "EstimateResults(\n"
-        return_str += f"    estimate_id={self.estimate_id}\n"
-        return_str += f"    number_of_cores={self.number_of_cores}\n"
-        return_str += f"    estimated_memory={self.estimated_memory}\n"
-        return_str += f"    estimated_run_times={self.estimated_run_times}\n"
-        return_str += f"    parts_count={self.parts_count}\n"
-        return_str += f"    type={self.type}\n"
-        return_str += f"    estimate_hashes={self.estimate_hashes}\n"
-        return_str += f"    parameters={self.parameters}\n"
-        return_str += ")"
-        return return_str
+        return (
+            "EstimateResults(\n"
+            f"    estimate_id={self.estimate_id}\n"
+            f"    number_of_cores={self.number_of_cores}\n"
+            f"    estimated_memory={self.estimated_memory}\n"
+            f"    estimated_run_times={self.estimated_run_times}\n"
+            f"    parts_count={self.parts_count}\n"
+            f"    type={self.type}\n"
+            f"    estimate_hashes={self.estimate_hashes}\n"
+            f"    parameters={self.parameters}\n"
+            ")"
+        )
 
     def __repr__(self) -> str:
         attrs = list()
-        for k, v in self.__dict__.items():
+        for k in self.__slots__:
+            v = getattr(self, k)
             if k.startswith("_"):
                 continue
             elif v is None:
@@ -85,69 +111,82 @@ class EstimateResults:
             >>> print(estimate_data.cost)
             0.012
         """
-        returnData = None
-        for idx in range(len(self.number_of_cores)):
-            curr_parts = 0
-            if self.parts_count is not None:
-                curr_parts = self.parts_count[idx]
-            # core count is 2 * parts for MNMPI
-            curr_cores = (
-                curr_parts * 2 if curr_parts > 31 else self.number_of_cores[idx]
-            )
-            if curr_cores % 2 > 0:
-                curr_cores = curr_cores + 1
-            curr_parts = curr_cores // 2
+        costs = self._core_hour_costs
+        order, sorted_costs = self._cost_ordering()
+        mnmpi_cores, mnmpi_parts = self._mnmpi_allocation()
 
-            total_cost = self.number_of_cores[idx] * (
-                self.estimated_run_times[idx] / 3600
-            )
-            if total_cost < max_spend:
-                if number_of_parts is None or curr_parts >= number_of_parts:
-                    if returnData is None or returnData.cost > total_cost:
-                        returnData = EstimateData(
-                            id=self.estimate_id,
-                            cores=curr_cores,
-                            memory=self.estimated_memory[idx],
-                            run_time=self.estimated_run_times[idx],
-                            parts=curr_parts,
-                            type=self.type,
-                            hash=self.estimate_hashes[idx],
-                            cost=total_cost,
-                            parameters=self.parameters,
-                        )
-        # if an estimate at the number of parts requested could not be found then work
-        # work backward from the number of parts requested to find the closest one
-        if returnData is None:
-            for idx in reversed(range(len(self.number_of_cores))):
-                curr_parts = 0
-                if self.parts_count is not None:
-                    curr_parts = self.parts_count[idx]
-                # core count is 2 * parts for MNMPI
-                curr_cores = (
-                    curr_parts * 2 if curr_parts > 31 else self.number_of_cores[idx]
-                )
-                if curr_cores % 2 > 0:
-                    curr_cores = curr_cores + 1
-                curr_parts = curr_cores // 2
+        # estimates are visited in order of increasing cost, stopping before the
+        # first which is not cheaper than max_spend. The first with at least the
+        # number of parts requested is the result, otherwise fall back to the
+        # cheapest with at most that number of parts, keeping the last of any
+        # equal costs
+        best_idx = None
+        best_le = None
+        for idx in order[: bisect.bisect_left(sorted_costs, max_spend)]:
+            curr_parts = mnmpi_parts[idx]
+            if number_of_parts is None or curr_parts >= number_of_parts:
+                best_idx = idx
+                break
+            if curr_parts <= number_of_parts:
+                if best_le is None or costs[idx] == costs[best_le]:
+                    best_le = idx
+        if best_idx is None:
+            best_idx = best_le
+        if best_idx is None:
+            return None
 
-                total_cost = self.number_of_cores[idx] * (
-                    self.estimated_run_times[idx] / 3600
+        return EstimateData._from_row(
+            self.estimate_id,
+            mnmpi_cores[best_idx],
+            self.estimated_memory[best_idx],
+            self.estimated_run_times[best_idx],
+            mnmpi_parts[best_idx],
+            self.estimate_hashes[best_idx],
+            costs[best_idx],
+            self.type,
+            self.parameters,
+        )
+
+    @property
+    def _core_hour_costs(self) -> list:
+        """The core hour cost of each estimate, calculated on first use"""
+        if self._costs is None:
+            self._costs = [
+                cores * (run_time / 3600)
+                for cores, run_time in zip(
+                    self.number_of_cores, self.estimated_run_times
                 )
-                if total_cost < max_spend:
-                    if number_of_parts is None or curr_parts <= number_of_parts:
-                        if returnData is None or returnData.cost > total_cost:
-                            returnData = EstimateData(
-                                id=self.estimate_id,
-                                cores=curr_cores,
-                                memory=self.estimated_memory[idx],
-                                run_time=self.estimated_run_times[idx],
-                                parts=curr_parts,
-                                type=self.type,
-                                hash=self.estimate_hashes[idx],
-                                cost=total_cost,
-                                parameters=self.parameters,
-                            )
-        return returnData
+            ]
+        return self._costs
+
+    def _cost_ordering(self):
+        """Returns the estimate indices sorted by core hour cost, along with the
+        sorted costs, calculated on first use. Equal costs keep their index order
+        """
+        if self._cost_order is None:
+            costs = self._core_hour_costs
+            self._cost_order = sorted(range(len(costs)), key=costs.__getitem__)
+            self._sorted_costs = [costs[idx] for idx in self._cost_order]
+        return self._cost_order, self._sorted_costs
+
+    def _mnmpi_allocation(self):
+        """Returns lists of the cores and parts to run each estimate with,
+        calculated on first use
+
+        The core count is 2 * parts for MNMPI and is rounded up to an even number
+        """
+        if self._mnmpi_cores is None:
+            parts_count = self.parts_count
+            if parts_count is None:
+                parts_count = [0] * len(self.number_of_cores)
+            self._mnmpi_cores = list()
+            for cores, curr_parts in zip(self.number_of_cores, parts_count):
+                # core count is 2 * parts for MNMPI
+                curr_cores = curr_parts * 2 if curr_parts > 31 else cores
+                # round odd core counts up to the next even number
+                self._mnmpi_cores.append((curr_cores + 1) & ~1)
+            self._mnmpi_parts = [cores >> 1 for cores in self._mnmpi_cores]
+        return self._mnmpi_cores, self._mnmpi_parts
 
     def get_lowest_core_hour_spend(self, number_of_parts: int = None):
         """Return the Estimate data with the loest core hour spend
@@ -192,31 +231,36 @@ class EstimateResults:
             >>> print(estimate_data.run_time)
             0.25
         """
-        returnData = None
-        for idx in range(len(self.number_of_cores)):
-            curr_parts = self.parts_count[idx]
-            # core count is 2 * parts for MNMPI
-            curr_cores = (
-                curr_parts * 2 if curr_parts > 31 else self.number_of_cores[idx]
-            )
+        order, _ = self._cost_ordering()
 
-            lowest_cost = self.number_of_cores[idx] * (
-                self.estimated_run_times[idx] / 3600
+        # with no parts constraint the cheapest estimate is the first in cost order,
+        # otherwise it is the first in cost order with enough parts
+        if number_of_parts is None:
+            best_idx = order[0] if order else None
+        else:
+            best_idx = next(
+                (idx for idx in order if self.parts_count[idx] >= number_of_parts),
+                None,
             )
-            if number_of_parts is None or curr_parts >= number_of_parts:
-                if returnData is None or returnData.cost < lowest_cost:
-                    returnData = EstimateData(
-                        id=self.estimate_id,
-                        cores=curr_cores,
-                        memory=self.estimated_memory[idx],
-                        run_time=self.estimated_run_times[idx],
-                        parts=curr_parts,
-                        type=self.type,
-                        hash=self.estimate_hashes[idx],
-                        cost=lowest_cost,
-                        parameters=self.parameters,
-                    )
-        return returnData
+        if best_idx is None:
+            return None
+
+        curr_parts = self.parts_count[best_idx]
+        # core count is 2 * parts for MNMPI
+        curr_cores = (
+            curr_parts * 2 if curr_parts > 31 else self.number_of_cores[best_idx]
+        )
+        return EstimateData._from_row(
+            self.estimate_id,
+            curr_cores,
+            self.estimated_memory[best_idx],
+            self.estimated_run_times[best_idx],
+            curr_parts,
+            self.estimate_hashes[best_idx],
+            self._core_hour_costs[best_idx],
+            self.type,
+            self.parameters,
+        )
 
     def get_quickest_run_time(self, number_of_parts: int = None):
         """Return the Estimate data with the loest core hour spend
@@ -261,28 +305,32 @@ class EstimateResults:
             >>> print(estimate_data.run_time)
             0.02
         """
-        returnData = None
-        for idx in range(len(self.number_of_cores)):
-            curr_parts = self.parts_count[idx]
-            # core count is 2 * parts for MNMPI
-            curr_cores = (
-                curr_parts * 2 if curr_parts > 31 else self.number_of_cores[idx]
-            )
+        run_times = self.estimated_run_times
+        best_idx = min(
+            (
+                idx
+                for idx in range(len(run_times))
+                if number_of_parts is None or self.parts_count[idx] >= number_of_parts
+            ),
+            key=run_times.__getitem__,
+            default=None,
+        )
+        if best_idx is None:
+            return None
 
-            quickest_run_time = self.estimated_run_times[idx]
-            if number_of_parts is None or curr_parts >= number_of_parts:
-                if returnData is None or returnData.run_time < quickest_run_time:
-                    calculated_cost = curr_cores * (
-                        self.estimated_run_times[idx] / 3600
-                    )
-                    returnData = EstimateData(
-                        id=self.estimate_id,
-                        cores=curr_cores,
-                        memory=self.estimated_memory[idx],
-                        run_time=self.estimated_run_times[idx],
-                        parts=curr_parts,
-                        type=self.type,
-                        hash=self.estimate_hashes[idx],
-                        cost=calculated_cost,
-                        parameters=self.parameters,
-                    )
+        curr_parts = self.parts_count[best_idx]
+        # core count is 2 * parts for MNMPI
+        curr_cores = (
+            curr_parts * 2 if curr_parts > 31 else self.number_of_cores[best_idx]
+        )
+        return EstimateData._from_row(
+            self.estimate_id,
+            curr_cores,
+            self.estimated_memory[best_idx],
+            run_times[best_idx],
+            curr_parts,
+            self.estimate_hashes[best_idx],
+            curr_cores * (run_times[best_idx] / 3600),
+            self.type,
+            self.parameters,
+        )
@@ -4,25 +4,57 @@ from onscale_client.api.rest_api import rest_api as RestApi
 
 from onscale_client.simulation import Simulation
 
-from .common.client_settings import ClientSettings, import_tqdm_notebook
+from .common.client_settings import ClientSettings, get_tqdm
 from .sockets import EstimateListener, JobListener
 
 from .estimate_results import EstimateResults
 from .job_progress import JobProgressManager
 
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
-from typing import List, Callable, Dict, Any, Optional
+from typing import List, Callable, Dict, Any, Optional, Tuple
 
 import os
-if import_tqdm_notebook():
-    from tqdm.notebook import tqdm  # type: ignore
-else:
-    from tqdm import tqdm  # type: ignore
+import threading
+import time
 
 
 ESTIMATE_TIME_OUT = 60 * 10
 
+# root file and blob lists cached for the download functions are requested again
+# once older than this many seconds
+FILE_LIST_CACHE_TTL_SECONDS = 10
+
+# job progress is requested again once older than this many seconds
+PROGRESS_CACHE_TTL_SECONDS = 1
+
+# simulation progress values which report a status rather than a percentage
+PROGRESS_STATUS = {-1: "cancelled", -2: "failed", -3: "delayed"}
+# progress values stored for the simulation statuses received on the job socket
+_STATUS_PROGRESS = {status.upper(): value for value, status in PROGRESS_STATUS.items()}
+
+
+def _as_enum(enum_cls, value):
+    """Returns value as a member of enum_cls, converting it only if it is not
+    already one"""
+    if isinstance(value, enum_cls):
+        return value
+    return enum_cls(value)
+
+
+def _job_data_property(name: str) -> property:
+    """Returns a read only property for the job data field name
+
+    The property returns None while the Job holds no job data.
+    """
+
+    def getter(self):
+        data = self._Job__data
+        return getattr(data, name) if data is not None else None
+
+    getter.__name__ = name
+    return property(getter)
+
 
 class Job(object):
     """Job object
@@ -31,6 +63,34 @@ class Job(object):
     on the cloud.
     """
 
+    __slots__ = (
+        "__data",
+        "__job_id",
+        "__account_id",
+        "__aes_key",
+        "__root_file_cache",
+        "__root_file_index",
+        "__blob_cache",
+        "__progress_response_cache",
+        "__client_token",
+        "__portal",
+        "_estimate_progress_val",
+        "estimate_progress_bar",
+        "job_progress_manager",
+        "_progress_cache",
+        "estimate_results",
+        "simulations",
+        "_sim_index_by_id",
+        "_sim_by_index",
+        "blob_ids",
+        "estimate_complete",
+        "_simulation_count",
+        "_tags",
+    )
+
+    # the public attributes which are shown by __repr__
+    _REPR_ATTRS = tuple(k for k in __slots__ if not k.startswith("_"))
+
     def __init__(
         self,
         create_new: bool,
@@ -66,27 +126,32 @@ class Job(object):
         """
 
         self.__data: Optional[datamodel.Job] = None
+        # job_id and account_id never change once the job exists so they are
+        # kept alongside the job data rather than read from it on every access
+        self.__job_id: Optional[str] = None
+        self.__account_id: Optional[str] = None
         self.__aes_key: Optional[str] = None
+        self.__root_file_cache: Optional[Tuple[float, List[datamodel.JobFile]]] = None
+        self.__root_file_index: Optional[Dict[str, datamodel.JobFile]] = None
+        self.__blob_cache: Optional[Tuple[float, List[datamodel.Blob]]] = None
+        self.__progress_response_cache: Optional[
+            Tuple[float, datamodel.JobProgress]
+        ] = None
         self.__client_token = client_token
         self.__portal = portal if portal is not None else "prod"
 
         self._estimate_progress_val: Optional[int] = None
-        self.estimate_progress_bar: Optional[tqdm.tqdm] = None
+        self.estimate_progress_bar: Optional[Any] = None
 
         self.job_progress_manager: Optional[JobProgressManager] = None
+        self._progress_cache: Optional[Dict[str, datamodel.SimulationProgress]] = None
 
         self.estimate_results = None
         self.simulations = None
+        self._sim_index_by_id: Dict[str, int] = dict()
+        self._sim_by_index: Dict[int, Simulation] = dict()
         self.blob_ids: List[Optional[str]] = []
 
-        def get_aes_key(job_id) -> str:
-            try:
-                aes_key_response = RestApi.aes_key(job_id=self.job_id)
-            except rest_api.ApiError as e:
-                print(f"APIError raised - {str(e)}")
-                return ""
-            return aes_key_response.key.plaintext_key
-
         if create_new:
             if account_id is None:
                 raise ValueError("account_id cannot be None")
@@ -97,25 +162,26 @@ class Job(object):
                 print(f"APIError raised - {str(e)}")
                 return
 
-            self.__data = datamodel.Job()
-            self.__data.job_id = job_id
-            self.__data.job_name = job_name
-            self.__data.account_id = account_id
-            self.__data.hpc_id = hpc_id
-            self.__data.preprocessor = datamodel.Preprocessor.NONE
-
-            if simulation_count is not None:
-                self.__data.simulation_count = simulation_count
-            else:
-                self.__data.simulation_count = 1
-
-            if operation is not None:
-                self.__data.operation = datamodel.Operation(operation)
-            else:
-                self.__data.operation = datamodel.Operation.REFLEX_MPI
-
-            self.__data.application = "onscalepython"
-            self.__aes_key = get_aes_key(self.job_id)
+            # the values are trusted so the model is constructed in a single
+            # call without running validation
+            self.__data = datamodel.Job.construct(
+                job_id=job_id,
+                job_name=job_name,
+                account_id=account_id,
+                hpc_id=hpc_id,
+                preprocessor=datamodel.Preprocessor.NONE,
+                simulation_count=(
+                    simulation_count if simulation_count is not None else 1
+                ),
+                operation=(
+                    _as_enum(datamodel.Operation, operation)
+                    if operation is not None
+                    else datamodel.Operation.REFLEX_MPI
+                ),
+                application="onscalepython",
+            )
+            self.__job_id = job_id
+            self.__account_id = account_id
 
             if not ClientSettings.getInstance().quiet_mode:
                 print(f"> Generated {self.job_name} - id : {self.job_id}")
@@ -127,18 +193,17 @@ class Job(object):
                     print(f"APIError raised - {str(e)}")
                     return
 
-                self.__data = job_load_request
+                self._set_job_data(job_load_request)
             else:
-                self.__data = job_data
-
-            self.__aes_key = get_aes_key(self.job_id)
+                self._set_job_data(job_data)
 
             sim_data = self.__data.simulations
             if sim_data is not None:
-                self.simulations = list()
-                for sim in sim_data:
-                    s = Simulation(simulation_data=sim, aes_key=self.aes_key)
-                    self.simulations.append(s)
+                self.simulations = [
+                    Simulation(simulation_data=sim, aes_key_source=self._job_aes_key)
+                    for sim in sim_data
+                ]
+                self._index_simulations()
 
             if self.simulation_count is not None:
                 if self.simulations is None and self.simulation_count > 0:
@@ -152,10 +217,25 @@ class Job(object):
 
     @property
     def aes_key(self) -> str:
+        # the key does not change for the life of the job, so it is requested on
+        # first use rather than each time a job is instantiated
         if self.__aes_key is None:
-            return ""
+            if self.job_id is None:
+                return ""
+            try:
+                aes_key_response = RestApi.aes_key(job_id=self.job_id)
+            except rest_api.ApiError as e:
+                print(f"APIError raised - {str(e)}")
+                self.__aes_key = ""
+                return self.__aes_key
+            self.__aes_key = aes_key_response.key.plaintext_key
         return self.__aes_key
 
+    def _job_aes_key(self) -> str:
+        """Returns the AES key of this job, given to its simulations so the key is
+        requested once for the job when first needed"""
+        return self.aes_key
+
     @property
     def portal(self) -> str:
         return self.__portal
@@ -166,105 +246,28 @@ class Job(object):
 
     @property
     def job_id(self):
-        if self.__data is not None:
-            return self.__data.job_id
-        return None
+        return self.__job_id
 
-    @property
-    def project_id(self):
-        if self.__data is not None:
-            return self.__data.project_id
-        return None
-
-    @property
-    def design_id(self):
-        if self.__data is not None:
-            return self.__data.design_id
-        return None
-
-    @property
-    def design_instance_id(self):
-        if self.__data is not None:
-            return self.__data.design_instance_id
-        return None
+    project_id = _job_data_property("project_id")
+    design_id = _job_data_property("design_id")
+    design_instance_id = _job_data_property("design_instance_id")
 
     @property
     def account_id(self):
-        if self.__data is not None:
-            return self.__data.account_id
-        return None
-
-    @property
-    def job_name(self):
-        if self.__data is not None:
-            return self.__data.job_name
-        return None
-
-    @property
-    def cores_required(self):
-        if self.__data is not None:
-            return self.__data.cores_required
-        return None
-
-    @property
-    def core_hour_estimate(self):
-        if self.__data is not None:
-            return self.__data.core_hour_estimate
-        return None
-
-    @property
-    def ram_estimate(self):
-        if self.__data is not None:
-            return self.__data.ram_estimate
-        return None
-
-    @property
-    def main_file(self):
-        if self.__data is not None:
-            return self.__data.main_file
-        return None
-
-    @property
-    def precision(self):
-        if self.__data is not None:
-            return self.__data.precision
-        return None
-
-    @property
-    def number_of_parts(self):
-        if self.__data is not None:
-            return self.__data.number_of_parts
-        return None
-
-    @property
-    def docker_tag_id(self):
-        if self.__data is not None:
-            return self.__data.docker_tag_id
-        return None
-
-    @property
-    def operation(self):
-        if self.__data is not None:
-            return self.__data.operation
-        return None
-
-    @property
-    def job_status(self):
-        if self.__data is not None:
-            return self.__data.job_status
-        return None
-
-    @property
-    def job_type(self):
-        if self.__data is not None:
-            return self.__data.job_type
-        return None
-
-    @property
-    def hpc_id(self):
-        if self.__data is not None:
-            return self.__data.hpc_id
-        return None
+        return self.__account_id
+
+    job_name = _job_data_property("job_name")
+    cores_required = _job_data_property("cores_required")
+    core_hour_estimate = _job_data_property("core_hour_estimate")
+    ram_estimate = _job_data_property("ram_estimate")
+    main_file = _job_data_property("main_file")
+    precision = _job_data_property("precision")
+    number_of_parts = _job_data_property("number_of_parts")
+    docker_tag_id = _job_data_property("docker_tag_id")
+    operation = _job_data_property("operation")
+    job_status = _job_data_property("job_status")
+    job_type = _job_data_property("job_type")
+    hpc_id = _job_data_property("hpc_id")
 
     @property
     def simulation_count(self):
@@ -281,71 +284,66 @@ class Job(object):
         if self.__data is not None:
             self.__data.simulation_count = count
 
-    @property
-    def tags(self):
-        if self.__data is not None:
-            return self.__data.tags
-        return None
-
-    @property
-    def job_cost(self):
-        if self.__data is not None:
-            return self.__data.job_cost
-        return None
+    tags = _job_data_property("tags")
+    job_cost = _job_data_property("job_cost")
+    last_status = _job_data_property("last_status")
+    application = _job_data_property("application")
 
-    @property
-    def last_status(self):
-        if self.__data is not None:
-            return self.__data.last_status
-        return None
+    def _set_job_data(self, job_data: datamodel.Job):
+        """Stores the job data along with the ids held for this job
 
-    @property
-    def application(self):
-        if self.__data is not None:
-            return self.__data.application
-        return None
+        Args:
+            job_data: datamodel.Job object containing the latest job data
+        """
+        self.__data = job_data
+        self.__job_id = job_data.job_id
+        self.__account_id = job_data.account_id
+        self.invalidate_file_cache()
 
     def __str__(self):
         """string representation of simulation object"""
-        return_str = "Job(\n"
-        return_str += f"    job_id={self.job_id},\n"
-        return_str += f"    job_name={self.job_name},\n"
-        return_str += f"    job_status={self.last_status},\n"
-        return_str += f"    simulation_count={self.simulation_count},\n"
-        return_str += f"    operation={self.operation},\n"
-        return_str += f"    precision={self.precision},\n"
-        return_str += f"    application={self.application},\n"
-        return_str += f"    docker_tag_id={self.docker_tag_id},\n"
-        return_str += f"    hpc_id={self.hpc_id},\n"
-        if self.project_id:
-            return_str += f"    project_id={self.project_id},\n"
-        if self.design_id:
-            return_str += f"    design_id={self.design_id},\n"
-        if self.design_instance_id:
-            return_str += f"    design_instance_id={self.design_instance_id},\n"
-        if self.account_id:
-            return_str += f"    account_id={self.account_id},\n"
-        if self.core_hour_estimate:
-            return_str += f"    core_hour_estimate={self.core_hour_estimate},\n"
-        if self.cores_required:
-            return_str += f"    cores_required={self.cores_required},\n"
-        if self.ram_estimate:
-            return_str += f"    ram_estimate={self.ram_estimate}\n"
-        if self.number_of_parts:
-            return_str += f"    number_of_parts={self.number_of_parts}\n"
-        return_str += ")"
-        return return_str
+        # read the fields from the job data directly rather than through the
+        # properties, which each check whether any job data is held
+        data = self.__data
+        if data is None:
+            data = datamodel.Job()
+        lines = [
+            "Job(",
+            f"    job_id={self.__job_id},",
+            f"    job_name={data.job_name},",
+            f"    job_status={data.last_status},",
+            f"    simulation_count={data.simulation_count},",
+            f"    operation={data.operation},",
+            f"    precision={data.precision},",
+            f"    application={data.application},",
+            f"    docker_tag_id={data.docker_tag_id},",
+            f"    hpc_id={data.hpc_id},",
+        ]
+        if data.project_id:
+            lines.append(f"    project_id={data.project_id},")
+        if data.design_id:
+            lines.append(f"    design_id={data.design_id},")
+        if data.design_instance_id:
+            lines.append(f"    design_instance_id={data.design_instance_id},")
+        if self.__account_id:
+            lines.append(f"    account_id={self.__account_id},")
+        if data.core_hour_estimate:
+            lines.append(f"    core_hour_estimate={data.core_hour_estimate},")
+        if data.cores_required:
+            lines.append(f"    cores_required={data.cores_required},")
+        if data.ram_estimate:
+            lines.append(f"    ram_estimate={data.ram_estimate}")
+        if data.number_of_parts:
+            lines.append(f"    number_of_parts={data.number_of_parts}")
+        lines.append(")")
+        return "\n".join(lines)
 
     def __repr__(self) -> str:
-        attrs = list()
-        for k, v in self.__dict__.items():
-            if k.startswith("_"):
-                continue
-            elif v is None:
-                continue
-            else:
-                attrs.append(f"{k}={str(v)}")
-        joined = ", ".join(attrs)
+        joined = ", ".join(
+            f"{k}={str(v)}"
+            for k, v in ((k, getattr(self, k, None)) for k in self._REPR_ATTRS)
+            if v is not None
+        )
         return f"{type(self).__name__}({joined})"
 
     def rename(self, new_name: str):
@@ -370,7 +368,7 @@ class Job(object):
             print(f"APIError raised - {str(e)}")
             return
 
-        self.__data = response
+        self._set_job_data(response)
         if not ClientSettings.getInstance().quiet_mode:
             print(f"job renamed as '{new_name}' successfully")
 
@@ -396,23 +394,18 @@ class Job(object):
             download_dir = os.getcwd()
 
         # job_file should go to the /job_name/job_files/ directory
-        download_dir = os.path.join(
-            download_dir,
-            self.job_name if self.job_name is not None else self.job_id,
-            "job_files",
-        )
+        download_dir = os.path.join(self._job_dir(download_dir), "job_files")
 
         # dont download any result files within this functtion
-        dl_list = list()
-
-        file_list = self.root_file_list()
-        for f in file_list:
-            if not isinstance(f.file_name, str):
-                continue
-            if "/" not in f.file_name:
-                dl_list.append(f)
-
-        RestApi.job_file_download(files=dl_list, file_path=download_dir)
+        dl_list = [
+            f
+            for f in self._cached_root_file_list()
+            if isinstance(f.file_name, str) and "/" not in f.file_name
+        ]
+
+        RestApi.job_file_download(
+            files=dl_list, file_path=download_dir, aes_key=self.aes_key
+        )
 
     def download_blob_files(
         self, download_dir: str = None, download_all_versions: bool = False
@@ -439,13 +432,23 @@ class Job(object):
         if download_dir is None:
             download_dir = os.getcwd()
 
-        blob_list = self.blob_list()
-        for b in blob_list:
-            self.download_blob_file(
-                blob=b,
-                download_dir=download_dir,
-                to_timestamp_folder=download_all_versions,
-            )
+        # the downloads are independent so are made concurrently, other than
+        # blobs which download to the same file which are kept in order on a
+        # single worker so the file is never written to by two at once
+        blob_dir = os.path.join(self._job_dir(download_dir), "blob_files")
+        blobs_by_path: Dict[str, List[datamodel.Blob]] = dict()
+        for b in self._cached_blob_list():
+            file_path = self._blob_file_path(b, blob_dir, download_all_versions)
+            blobs_by_path.setdefault(file_path, list()).append(b)
+        if not blobs_by_path:
+            return
+
+        def download_blobs(file_path: str):
+            for b in blobs_by_path[file_path]:
+                self._download_blob(b, file_path, download_all_versions)
+
+        with ThreadPoolExecutor(max_workers=min(8, len(blobs_by_path))) as executor:
+            list(executor.map(download_blobs, blobs_by_path))
 
     def download_all(self, download_dir: str = None):
         """Download all files associate with this job
@@ -463,11 +466,37 @@ class Job(object):
         if download_dir is None:
             download_dir = os.getcwd()
 
-        self.download_job_files(download_dir)
-        self.download_blob_files(download_dir)
-        self.download_results(download_dir)
+        settings = ClientSettings.getInstance()
+        quiet_mode = settings.quiet_mode
+        if not quiet_mode:
+            print(f"* Downloading all files for {self.job_name}")
 
-        if not ClientSettings.getInstance().quiet_mode:
+        # the job, blob and result files are independent so are downloaded
+        # concurrently, in quiet mode as their progress output would interleave
+        settings.quiet_mode = True
+        try:
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = [
+                    executor.submit(download, download_dir)
+                    for download in (
+                        self.download_job_files,
+                        self.download_blob_files,
+                        self.download_results,
+                    )
+                ]
+                results = [future.exception() for future in futures]
+        finally:
+            settings.quiet_mode = quiet_mode
+
+        # every download is completed, the first error is raised once the
+        # others are reported
+        errors = [e for e in results if e is not None]
+        for e in errors[1:]:
+            print(f"Error raised downloading files - {str(e)}")
+        if errors:
+            raise errors[0]
+
+        if not quiet_mode:
             if ClientSettings.getInstance().is_jupyter:
                 try:
                     from IPython.core.display import display, HTML  # type: ignore
@@ -509,15 +538,8 @@ class Job(object):
             if file_name is None:
                 return ValueError("download_file -  argument file cannot be None")
             else:
-                file_list = self.root_file_list()
-                for f in file_list:
-                    if not isinstance(f.file_name, str):
-                        continue
-                    if "/" in f.file_name:
-                        continue
-                    if file_name == f.file_name:
-                        file = f
-                        break
+                # only root level files can be downloaded by name
+                file = self._root_file_index().get(file_name)
         if file is None:
             print(f"Error downloading {file_name}")
             return
@@ -528,11 +550,8 @@ class Job(object):
         try:
             RestApi.job_file_download(
                 files=[file],
-                file_path=os.path.join(
-                    download_dir,
-                    self.job_name if self.job_name is not None else self.job_id,
-                    "job_files",
-                ),
+                file_path=os.path.join(self._job_dir(download_dir), "job_files"),
+                aes_key=self.aes_key,
             )
         except rest_api.ApiError as e:
             print(f"* Error downloading {file.file_name}")
@@ -582,40 +601,38 @@ class Job(object):
             if simulation_index > self.simulation_count - 1:
                 raise ValueError(
                     f"invalid simulation_index specified. "
-                    f"{len(self.simulation_count)} simulations available."
+                    f"{self.simulation_count} simulations available."
                 )
-            for s in self.simulations:
-                if s.index == simulation_index:
-                    simulation_id = s.id
+            sim = self._sim_by_index.get(simulation_index)
+            if sim is not None:
+                simulation_id = sim.id
         else:
             if simulation_id is None:
                 raise ValueError("simulation_id or simulation_index must be specified")
-            for idx, s in enumerate(self.simulations):
-                simulation_index = idx
-                if s.id == simulation_id:
-                    if s.index is not None:
-                        simulation_index = s.index
+            simulation_index = self._sim_index_by_id.get(simulation_id)
+            if simulation_index is None:
+                raise ValueError(f"invalid simulation_id specified. {simulation_id}")
 
         assert simulation_index is not None
 
         download_folder = os.path.join(
-            self.job_name if self.job_name is not None else self.job_id,
-            "results",
-            str(simulation_index + 1),
+            self._job_dir(download_dir), "results", str(simulation_index + 1)
         )
 
-        file = None
-        file_list = self.simulation_file_list(simulation_id=simulation_id)
-        for f in file_list:
-            if not isinstance(f.file_name, str):
-                continue
-            if file_name in f.file_name:
-                file = f
-                break
+        file = next(
+            (
+                f
+                for f in self.simulation_file_list(simulation_id=simulation_id)
+                if isinstance(f.file_name, str) and file_name in f.file_name
+            ),
+            None,
+        )
         if file is not None:
             try:
                 RestApi.job_file_download(
-                    files=[file], file_path=os.path.join(download_dir, download_folder)
+                    files=[file],
+                    file_path=download_folder,
+                    aes_key=self.aes_key,
                 )
             except rest_api.ApiError as e:
                 print(f"* Error downloading {file.file_name}")
@@ -663,37 +680,77 @@ class Job(object):
         if download_dir is None:
             download_dir = os.getcwd()
 
-        dl_path = os.path.join(
-            download_dir,
-            self.job_name if self.job_name is not None else self.job_id,
-            "blob_files",
+        blob_dir = os.path.join(self._job_dir(download_dir), "blob_files")
+        self._download_blob(
+            blob,
+            self._blob_file_path(blob, blob_dir, to_timestamp_folder),
+            to_timestamp_folder,
         )
 
-        if blob is not None:
-            assert isinstance(blob.original_file_name, str)
-            file_name = blob.original_file_name
-            dl_path = os.path.join(dl_path, blob.blob_type.name)
-
-            if blob.object_type == "DESIGNINSTANCE":
-                if to_timestamp_folder:
-                    assert isinstance(blob.object_id, str)
-                    assert isinstance(blob.create_date, int)
-                    dl_path = os.path.join(dl_path, blob.object_id)
-                    t = datetime.fromtimestamp(blob.create_date / 1000.0)
-                    time_str = t.strftime("%Y-%m-%d %H:%M:%S")
-                    dl_path = os.path.join(dl_path, time_str.replace(" ", "_"))
-                else:
-                    if os.path.exists(os.path.join(dl_path, file_name)):
-                        return
+    def _download_blob(
+        self, blob: datamodel.Blob, file_path: str, to_timestamp_folder: bool
+    ):
+        """Downloads blob to file_path
 
-            try:
-                RestApi.blob_download([blob], os.path.join(dl_path, file_name))
-            except rest_api.ApiError as e:
-                print(f"* Error downloading {file_name}")
-                if ClientSettings.getInstance().debug_mode:
-                    print(f"APIError raised - {str(e)}")
+        Args:
+            blob: the blob object being downloaded
+            file_path: The full path to download the blob to, as returned by
+              _blob_file_path
+            to_timestamp_folder: Whether file_path places the blob within a
+              directory identifying its creation date.
+        """
+        if blob.object_type == "DESIGNINSTANCE" and not to_timestamp_folder:
+            if os.path.exists(file_path):
                 return
 
+        try:
+            RestApi.blob_download([blob], file_path)
+        except rest_api.ApiError as e:
+            print(f"* Error downloading {blob.original_file_name}")
+            if ClientSettings.getInstance().debug_mode:
+                print(f"APIError raised - {str(e)}")
+            return
+
+    def _blob_file_path(
+        self, blob: datamodel.Blob, blob_dir: str, to_timestamp_folder: bool
+    ) -> str:
+        """Returns the full path which blob is downloaded to
+
+        Args:
+            blob: the blob object being downloaded
+            blob_dir: The directory which this job's blob files are downloaded to
+            to_timestamp_folder: Places design instance blobs within a directory
+              identifying the creation date of the file.
+        """
+        assert isinstance(blob.original_file_name, str)
+        dl_path = os.path.join(blob_dir, blob.blob_type.name)
+
+        if blob.object_type == "DESIGNINSTANCE" and to_timestamp_folder:
+            assert isinstance(blob.object_id, str)
+            assert isinstance(blob.create_date, int)
+            dl_path = os.path.join(dl_path, blob.object_id)
+            # the local creation time, formatted as %Y-%m-%d_%H:%M:%S
+            t = time.localtime(blob.create_date / 1000.0)
+            time_str = (
+                f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}_"
+                f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+            )
+            dl_path = os.path.join(dl_path, time_str)
+
+        return os.path.join(dl_path, blob.original_file_name)
+
+    def _job_dir(self, download_dir: str) -> str:
+        """Returns the directory within download_dir which this job's files are
+        downloaded to
+
+        Args:
+            download_dir: The full path of the download directory
+        """
+        return os.path.join(
+            download_dir,
+            self.job_name if self.job_name is not None else self.job_id,
+        )
+
     def submit(
         self,
         cores_required=None,
@@ -780,10 +837,7 @@ class Job(object):
         self.__data.main_file = main_file
 
         if operation is not None:
-            if isinstance(operation, datamodel.Operation):
-                self.__data.operation = operation
-            else:
-                self.__data.operation = datamodel.Operation(operation)
+            self.__data.operation = _as_enum(datamodel.Operation, operation)
         if self.operation is None:
             self.__data.operation = datamodel.Operation(
                 self._operation_from_input(self.main_file)
@@ -797,12 +851,9 @@ class Job(object):
         #         self._operation_to_mnmpi(self.__data.operation.value))
 
         if precision is not None:
-            if isinstance(precision, datamodel.Precision3):
-                self.__data.precision = precision
-            else:
-                self.__data.precision = datamodel.Precision3(precision)
+            self.__data.precision = _as_enum(datamodel.Precision3, precision)
         if self.__data.precision is None:
-            self.__data.precision = datamodel.Precision3("SINGLE")
+            self.__data.precision = datamodel.Precision3.SINGLE
 
         if docker_tag_id is not None:
             self.__data.docker_tag_id = docker_tag_id
@@ -834,43 +885,43 @@ class Job(object):
             self.__data.simulations = simulations
         if self.simulations is None:
             if self.__data.simulations is None:
-                self.simulations = list()
-                self.__data.simulations = list()
-                for i in range(0, self.simulation_count):
-                    if operation in ("SIMULATION", "MPI", "MNMPI", "BUILD", "REVIEW"):
-                        console_parameters = (
-                            f"-mem mb {ram_estimate} {0.1*ram_estimate} "
-                        )
-                        if operation in ("SIMULATION", "BUILD", "REVIEW"):
-                            console_parameters += f"-noterm -mp {cores_required} stat"
-                        else:
-                            console_parameters += f"-noterm -nparts {number_of_parts}"
-                    else:
-                        console_parameters = "IGNORE"
-                    blob = required_blobs[i] if required_blobs is not None else None
-                    sim_data = Simulation.get_default_sim_data(
-                        job_id=self.job_id,
-                        account_id=self.account_id,
-                        index=i,
-                        console_parameters=console_parameters,
-                        required_blobs=None if (blob is None or i == 0) else [blob],
+                # console parameters are the same for every simulation
+                if operation in ("SIMULATION", "BUILD", "REVIEW"):
+                    console_parameters = (
+                        f"-mem mb {ram_estimate} {0.1*ram_estimate} "
+                        f"-noterm -mp {cores_required} stat"
                     )
-                    self.__data.simulations.append(sim_data)
-
-                    self.simulations.append(
-                        Simulation(aes_key=self.aes_key, simulation_data=sim_data)
+                elif operation in ("MPI", "MNMPI"):
+                    console_parameters = (
+                        f"-mem mb {ram_estimate} {0.1*ram_estimate} "
+                        f"-noterm -nparts {number_of_parts}"
                     )
-            else:
-                for s in self.__data.simulations:
-                    self.simulations = list()
-                    self.simulations.append(
-                        Simulation(aes_key=self.aes_key, simulation_data=s)
+                else:
+                    console_parameters = "IGNORE"
+                self.__data.simulations = Simulation.bulk_default_sim_data(
+                    job_id=self.job_id,
+                    account_id=self.account_id,
+                    count=self.simulation_count,
+                    console_parameters=console_parameters,
+                    required_blobs=required_blobs,
+                )
+                self.simulations = [
+                    Simulation(
+                        aes_key_source=self._job_aes_key, simulation_data=sim_data
                     )
+                    for sim_data in self.__data.simulations
+                ]
+            else:
+                self.simulations = [
+                    Simulation(aes_key_source=self._job_aes_key, simulation_data=s)
+                    for s in self.__data.simulations
+                ]
         else:
-            self.__data.simulations = list()
-            for sim in self.simulations:
-                if isinstance(sim.sim_data, datamodel.Simulation):
-                    self.__data.simulations.append(sim.sim_data)
+            self.__data.simulations = [
+                sim.sim_data
+                for sim in self.simulations
+                if isinstance(sim.sim_data, datamodel.Simulation)
+            ]
 
         self.__data.job_type = job_type
         self.__data.hpc_id = hpc_id
@@ -885,7 +936,7 @@ class Job(object):
         try:
             # self.__data = RestApi.job_submit(self.__data)
             self.__data.docker_tag = "default"
-            self.__data = RestApi.job_submit_from_job(self.__data)
+            self._set_job_data(RestApi.job_submit_from_job(self.__data))
 
         except rest_api.ApiError as e:
             print(f"APIError raised - {str(e)}")
@@ -915,25 +966,28 @@ class Job(object):
             >>> print(last_job.get_progress())
             99
         """
-        try:
-            response = RestApi.job_progress(self.job_id)
-        except rest_api.ApiError as e:
-            print(f"APIError raised - {str(e)}")
-            return "error"
+        progress_list = self._streamed_progress_list()
+        if progress_list is None:
+            try:
+                response = self._job_progress()
+            except rest_api.ApiError as e:
+                print(f"APIError raised - {str(e)}")
+                return "error"
+            progress_list = response.simulation_progress_list
 
-        progress_list = response.simulation_progress_list
         if progress_list is not None:
-            total_progress = 0
+            progress_values: List[int] = list()
             for p in progress_list:
                 assert isinstance(p.progress, int)
-                if p.progress == -1:
-                    return "cancelled"
-                elif p.progress == -2:
-                    return "failed"
-                elif p.progress == -3:
-                    return "delayed"
-                total_progress += p.progress
-            return str(int(total_progress / len(progress_list)))
+                progress_values.append(p.progress)
+            # the first simulation reporting a status determines the job status
+            status = next(
+                (PROGRESS_STATUS[v] for v in progress_values if v in PROGRESS_STATUS),
+                None,
+            )
+            if status is not None:
+                return status
+            return str(int(sum(progress_values) / len(progress_values)))
         else:
             return "unknown"
 
@@ -957,25 +1011,46 @@ class Job(object):
             [{simulation_id: 954e70b-237a-4cdb-a267-b5da0f67dd70, progress: 85}]
         """
         return_list = list()
-        try:
-            response = RestApi.job_progress(self.job_id)
-        except rest_api.ApiError as e:
-            print(f"APIError raised - {str(e)}")
-            return None
+        progress_list = self._streamed_progress_list()
+        if progress_list is None:
+            try:
+                response = self._job_progress()
+            except rest_api.ApiError as e:
+                print(f"APIError raised - {str(e)}")
+                return None
+            progress_list = response.simulation_progress_list
 
-        progress_list = response.simulation_progress_list
         if progress_list is not None:
             if simulation_ids is not None:
-                for p in progress_list:
-                    if p.simulation_id in simulation_ids:
-                        return_list.append(p.__dict__)
+                id_set = set(simulation_ids)
+                return_list = [
+                    p.dict() for p in progress_list if p.simulation_id in id_set
+                ]
             elif simulation_indexes is not None:
-                for idx, p in enumerate(progress_list):
-                    if idx in simulation_indexes:
-                        return_list.append(p.__dict__)
+                # indexes are looked up directly, in progress list order
+                return_list = [
+                    progress_list[idx].dict()
+                    for idx in sorted(set(simulation_indexes))
+                    if 0 <= idx < len(progress_list)
+                ]
 
         return return_list
 
+    def _job_progress(self) -> datamodel.JobProgress:
+        """Returns the job progress, requesting it from the server only if the
+        last response is older than PROGRESS_CACHE_TTL_SECONDS
+
+        Raises:
+            ApiError: includes HTTP error code indicating error
+        """
+        if self.__progress_response_cache is not None:
+            fetch_time, response = self.__progress_response_cache
+            if time.monotonic() - fetch_time < PROGRESS_CACHE_TTL_SECONDS:
+                return response
+        response = RestApi.job_progress(self.job_id)
+        self.__progress_response_cache = (time.monotonic(), response)
+        return response
+
     def upload_file(self, file_name: str, simulation_id: str = None):
         """Upload a file to be used for this job
 
@@ -1003,6 +1078,7 @@ class Job(object):
             print(f"* Error uploading file: {file_name}")
             print(f"APIError raised - {str(e)}")
             return
+        self.invalidate_file_cache()
 
         if not ClientSettings.getInstance().quiet_mode:
             if success and simulation_id is not None:
@@ -1116,6 +1192,8 @@ class Job(object):
             self.__data.design_id = response.design_id
             if response.design_instance_list:
                 self.__data.design_instance_id = response.design_instance_list[0].design_instance_id
+            # blobs are listed by design and design instance as well as job
+            self.invalidate_file_cache()
 
         return self.design_id
 
@@ -1153,7 +1231,58 @@ class Job(object):
             >>> print(blob_id)
             '954e70b-237a-4cdb-a267-b5da0f67dd70'
         """
+        blob_id = self._upload_blob(blob_type, file_name, blob_title, blob_description)
+        if blob_id is not None and blob_type == datamodel.BlobType.CAD:
+            self.blob_ids.append(blob_id)
+        return blob_id
 
+    def upload_blobs(
+        self, blob_type: datamodel.BlobType, file_names: List[str]
+    ) -> List[Optional[str]]:
+        """Upload several blob files of the same type to be used for this job
+
+            The blob files are independent of each other so are uploaded
+            concurrently.
+
+        Args:
+            blob _type: type of blob object being uploaded
+            file_names: full file paths of the files being uploaded
+
+        Returns:
+            The blob_id for each of the files being uploaded, in the order of
+            file_names. None is returned for any file which failed to upload.
+
+        Example:
+            >>> import onscale_client as os
+            >>> client = os.Client()
+            >>> new_job = client.create_job(job_name='new_job_1')
+            >>> blob_ids = new_job.upload_blobs(blob_type='CAD',
+            ...                                 file_names=['/tmp/part_1.stp',
+            ...                                             '/tmp/part_2.stp'])
+            >>> print(blob_ids)
+            ['954e70b-237a-4cdb-a267-b5da0f67dd70', '6392e70b-123a-0cfa-a457-b5bc0f89dd70']
+        """
+        if not file_names:
+            return list()
+
+        def upload(file_name: str) -> Optional[str]:
+            return self._upload_blob(blob_type, file_name)
+
+        with ThreadPoolExecutor(max_workers=min(8, len(file_names))) as executor:
+            blob_ids = list(executor.map(upload, file_names))
+
+        # blob ids are recorded in the order given rather than upload order
+        if blob_type == datamodel.BlobType.CAD:
+            self.blob_ids.extend(b for b in blob_ids if b is not None)
+        return blob_ids
+
+    def _upload_blob(
+        self,
+        blob_type: datamodel.BlobType,
+        file_name: str,
+        blob_title=None,
+        blob_description=None,
+    ) -> Optional[str]:
         try:
             response = RestApi.blob_upload(
                 object_id=self.design_instance_id,
@@ -1167,14 +1296,12 @@ class Job(object):
             print(f"APIError raised - {str(e)}")
             # remove any temp file we have created
             return
+        self.invalidate_file_cache()
 
         if not ClientSettings.getInstance().quiet_mode:
             print(f"* blob file {os.path.basename(file_name)} successfully uploaded")
             print(f"> blob id : {response.blob_id}")
 
-        if blob_type == datamodel.BlobType.CAD:
-            self.blob_ids.append(response.blob_id)
-
         return response.blob_id
 
     def upload_blob_child(
@@ -1220,6 +1347,7 @@ class Job(object):
             print(f"APIError raised - {str(e)}")
             # remove any temp file we have created
             return ""
+        self.invalidate_file_cache()
 
         if not ClientSettings.getInstance().quiet_mode:
             print(f"* blob file {os.path.basename(file_name)} successfully uploaded")
@@ -1234,27 +1362,29 @@ class Job(object):
         Args:
             msg: The message recieved on the user socket
         """
-        if not ClientSettings.getInstance().quiet_mode:
+        settings = ClientSettings.getInstance()
+        if not settings.quiet_mode:
             finished = msg["finished"]
             total = msg["total"]
             updated_progress = int((finished / total) * 100)
 
             if self.estimate_progress_bar is None:
-                self.estimate_progress_bar = tqdm(
+                # redraws are limited so frequent messages do not flood the terminal
+                self.estimate_progress_bar = get_tqdm()(
                     total=100,
                     desc="> Progress:",
                     bar_format="{l_bar}|{bar}|{n_fmt}/{total_fmt}",
+                    mininterval=0.25,
+                    smoothing=0,
                 )
-            if self._estimate_progress_val is not None:
-                self.estimate_progress_bar.update(
-                    updated_progress - self._estimate_progress_val
-                )
-            else:
-                self.estimate_progress_bar.update(updated_progress)
+            # the bar only shows whole percentages so unchanged values are skipped
+            delta = updated_progress - (self._estimate_progress_val or 0)
+            if delta:
+                self.estimate_progress_bar.update(delta)
 
             self._estimate_progress_val = updated_progress
 
-        if ClientSettings.getInstance().debug_mode:
+        if settings.debug_mode:
             print(f"socket message : {msg}")
 
     def _on_estimate_status(self, msg: Dict[str, Any]):
@@ -1263,8 +1393,9 @@ class Job(object):
         Args:
             msg: The message recieved on the user socket
         """
-        if not ClientSettings.getInstance().quiet_mode:
-            if ClientSettings.getInstance().debug_mode:
+        settings = ClientSettings.getInstance()
+        if not settings.quiet_mode:
+            if settings.debug_mode:
                 print(f'estimate {msg["status"]}')
             else:
                 if msg["status"] == "RUNNING":
@@ -1280,13 +1411,13 @@ class Job(object):
                 self.estimate_results = -1
                 self._estimate_progress_val = None
                 self.estimate_complete = True
-                if not ClientSettings.getInstance().quiet_mode:
+                if not settings.quiet_mode:
                     if self.estimate_progress_bar is not None:
                         self.estimate_progress_bar.close()
-                if ClientSettings.getInstance().debug_mode:
+                if settings.debug_mode:
                     print(msg["debug"])
             else:
-                if ClientSettings.getInstance().debug_mode:
+                if settings.debug_mode:
                     print(f"socket message : {msg}")
 
     def _on_estimate_results(self, msg: Dict[str, Any]):
@@ -1299,8 +1430,9 @@ class Job(object):
         Args:
             msg: The message recieved on the user socket
         """
+        settings = ClientSettings.getInstance()
         self._estimate_progress_val = None
-        if not ClientSettings.getInstance().quiet_mode:
+        if not settings.quiet_mode:
             if self.estimate_progress_bar is not None:
                 self.estimate_progress_bar.close()
         self.estimate_results = EstimateResults(
@@ -1314,10 +1446,10 @@ class Job(object):
             parameters=msg["parameters"],
         )
 
-        if ClientSettings.getInstance().debug_mode:
+        if settings.debug_mode:
             print(f"socket message : {msg}")
 
-        if not ClientSettings.getInstance().quiet_mode:
+        if not settings.quiet_mode:
             print("\r> Estimate completed successfully")
             if self.estimate_progress_bar is not None:
                 self.estimate_progress_bar.close()
@@ -1395,13 +1527,13 @@ class Job(object):
             if self.operation is None:
                 raise ValueError("No operation type specified for estimation")
         else:
-            self.__data.operation = datamodel.Operation(operation)
+            self.__data.operation = _as_enum(datamodel.Operation, operation)
 
         if precision is None:
             if self.precision is None:
                 raise ValueError("No precision specified for estimation")
         else:
-            self.__data.precision = datamodel.Precision3(precision)
+            self.__data.precision = _as_enum(datamodel.Precision3, precision)
 
         if docker_tag_id is not None:
             self.__data.docker_tag_id = docker_tag_id
@@ -1441,11 +1573,12 @@ class Job(object):
         """
         # print(f"{msg.get('simulationId')}:{msg.get('progress')}")
         sim_id = str(msg.get("simulationId"))
-        if self.job_progress_manager is None:
-            self.job_progress_manager = JobProgressManager()
-        if not self.job_progress_manager.sim_exists(sim_id):
-            self.job_progress_manager.add_simulation(sim_id)
-        self.job_progress_manager.set_progress(sim_id, int(str(msg.get("progress"))))
+        manager = self.job_progress_manager
+        if manager is None:
+            manager = self.job_progress_manager = JobProgressManager()
+        if not manager.sim_exists(sim_id):
+            manager.add_simulation(sim_id)
+        manager.set_progress(sim_id, int(str(msg.get("progress"))))
 
     def _on_job_finished(self, msg: Dict[str, Any]):
         """Callback Function invoked when job finished messages are
@@ -1466,18 +1599,19 @@ class Job(object):
     def _on_job_status(self, msg: Dict[str, Any]):
         sim_id = str(msg.get("simulationId"))
         status = str(msg.get("status"))
-        if self.job_progress_manager is None:
-            self.job_progress_manager = JobProgressManager()
-        if not self.job_progress_manager.sim_exists(sim_id):
-            self.job_progress_manager.add_simulation(sim_id)
-        self.job_progress_manager.set_status(sim_id, status.upper())
+        manager = self.job_progress_manager
+        if manager is None:
+            manager = self.job_progress_manager = JobProgressManager()
+        if not manager.sim_exists(sim_id):
+            manager.add_simulation(sim_id)
+        manager.set_status(sim_id, status.upper())
 
     def subscribe_to_progress(
         self,
         on_job_progress: Callable = None,
         on_job_finished: Callable = None,
         on_job_status: Callable = None,
-        timeout: int = None,
+        timeout: Optional[int] = None,
     ):
         """Subscribe to progress messages for this job
 
@@ -1514,6 +1648,92 @@ class Job(object):
         except TimeoutError:
             print("Timed out waiting for progress")
 
+    def stream_progress(self, timeout: Optional[int] = None):
+        """Subscribe to progress messages for this job in the background
+
+        Progress and status messages received on the job socket are cached so
+        that get_progress and get_simulation_progress can be answered without a
+        request to the server while the subscription is active. Nothing is
+        printed while streaming.
+
+        Args:
+            timeout: the timeout length in seconds. defaults to None
+
+        Example:
+            >>> import onscale_client as os
+            >>> client = os.Client()
+            >>> last_job = client.get_last_job()
+            >>> last_job.stream_progress()
+            >>> print(last_job.get_progress())
+            99
+        """
+        if self._progress_cache is not None:
+            return
+        self._progress_cache = dict()
+        thread = threading.Thread(
+            target=self._stream_progress, args=(timeout,), daemon=True
+        )
+        thread.start()
+
+    def _stream_progress(self, timeout: Optional[int]):
+        try:
+            self.subscribe_to_progress(
+                on_job_progress=self._on_streamed_progress,
+                on_job_status=self._on_streamed_status,
+                timeout=timeout,
+            )
+        finally:
+            # progress is requested from the server once the subscription ends
+            self._progress_cache = None
+
+    def _on_streamed_progress(self, msg: Dict[str, Any]):
+        """Callback Function invoked when job progress messages are
+            received while streaming progress
+
+        Args:
+            msg: The message recieved on the job socket
+        """
+        cache = self._progress_cache
+        if cache is not None:
+            sim_id = str(msg.get("simulationId"))
+            cache[sim_id] = datamodel.SimulationProgress(
+                simulationId=sim_id, progress=int(str(msg.get("progress")))
+            )
+
+    def _on_streamed_status(self, msg: Dict[str, Any]):
+        """Callback Function invoked when simulation status messages are
+            received while streaming progress. Cancelled, failed and delayed
+            simulations are cached with the matching PROGRESS_STATUS value.
+
+        Args:
+            msg: The message recieved on the job socket
+        """
+        cache = self._progress_cache
+        progress = _STATUS_PROGRESS.get(str(msg.get("status")).upper())
+        if cache is not None and progress is not None:
+            sim_id = str(msg.get("simulationId"))
+            cache[sim_id] = datamodel.SimulationProgress(
+                simulationId=sim_id, progress=progress
+            )
+
+    def _streamed_progress_list(self) -> Optional[List[datamodel.SimulationProgress]]:
+        """Returns the streamed simulation progress ordered by simulation index
+
+        None is returned if progress is not being streamed or has not yet been
+        received for every simulation of this job.
+        """
+        cache = self._progress_cache
+        if not cache or len(cache) < len(self.simulations or ()):
+            return None
+        indexed = list()
+        for sim_id, progress in list(cache.items()):
+            sim_index = self._sim_index_by_id.get(sim_id)
+            if sim_index is None:
+                return None
+            indexed.append((sim_index, progress))
+        indexed.sort(key=lambda i: i[0])
+        return [progress for _, progress in indexed]
+
     def download_results(
         self,
         download_dir: str = None,
@@ -1562,11 +1782,7 @@ class Job(object):
         if download_dir is None:
             download_dir = os.getcwd()
 
-        download_dir = os.path.join(
-            download_dir,
-            self.job_name if self.job_name is not None else self.job_id,
-            "results",
-        )
+        download_dir = os.path.join(self._job_dir(download_dir), "results")
 
         # standardize extension filter list. Add a "." if not already present
         if extension_filter is not None:
@@ -1581,7 +1797,9 @@ class Job(object):
                     simulation_id = self.simulations[i].simulation_id
                     if simulation_id is not None:
                         sim_file_list = self.simulation_file_list(simulation_id)
-                        RestApi.sim_file_download(sim_file_list, download_dir, i)
+                        RestApi.sim_file_download(
+                            sim_file_list, download_dir, i, aes_key=self.aes_key
+                        )
         else:
             if self.simulations is not None:
                 for sim in self.simulations:
@@ -1589,7 +1807,10 @@ class Job(object):
                     if simulation_id is not None:
                         sim_file_list = self.simulation_file_list(simulation_id)
                         RestApi.sim_file_download(
-                            sim_file_list, download_dir, sim.index
+                            sim_file_list,
+                            download_dir,
+                            sim.index,
+                            aes_key=self.aes_key,
                         )
 
     def root_file_list(self) -> List[datamodel.JobFile]:
@@ -1613,7 +1834,35 @@ class Job(object):
         except rest_api.ApiError as e:
             print(f"ApiError raised - {str(e)}")
             raise
-        return response
+        self.__root_file_cache = (time.monotonic(), response)
+        self.__root_file_index = None
+        return list(response)
+
+    def _cached_root_file_list(self) -> List[datamodel.JobFile]:
+        """Returns the root file list of this job, which is only requested again
+        once the cached list is older than FILE_LIST_CACHE_TTL_SECONDS. Used by
+        the download functions, root_file_list always requests the list.
+        """
+        if self.__root_file_cache is not None:
+            fetch_time, file_list = self.__root_file_cache
+            if time.monotonic() - fetch_time < FILE_LIST_CACHE_TTL_SECONDS:
+                return list(file_list)
+        return self.root_file_list()
+
+    def _root_file_index(self) -> Dict[str, datamodel.JobFile]:
+        """Returns the root level files of this job keyed by file name
+
+        The index is built from the cached root file list and is rebuilt
+        whenever that list is requested again.
+        """
+        file_list = self._cached_root_file_list()
+        if self.__root_file_index is None:
+            index: Dict[str, datamodel.JobFile] = dict()
+            for f in file_list:
+                if isinstance(f.file_name, str) and "/" not in f.file_name:
+                    index.setdefault(f.file_name, f)
+            self.__root_file_index = index
+        return self.__root_file_index
 
     def file_list(self) -> List[datamodel.JobFile]:
         """Returns a list of files associated with this job
@@ -1722,7 +1971,33 @@ class Job(object):
                         continue
                     return_blobs.extend(child_blobs)
 
-        return return_blobs
+        self.__blob_cache = (time.monotonic(), return_blobs)
+        return list(return_blobs)
+
+    def _cached_blob_list(self) -> List[datamodel.Blob]:
+        """Returns the blob list of this job, which is only requested again once
+        the cached list is older than FILE_LIST_CACHE_TTL_SECONDS. Used by the
+        download functions, blob_list always requests the list.
+        """
+        if self.__blob_cache is not None:
+            fetch_time, blobs = self.__blob_cache
+            if time.monotonic() - fetch_time < FILE_LIST_CACHE_TTL_SECONDS:
+                return list(blobs)
+        return self.blob_list()
+
+    def invalidate_file_cache(self):
+        """Clears the cached root file and blob lists so that they are requested
+        again on next use.
+
+        Example:
+            >>> import onscale_client as os
+            >>> client = os.Client()
+            >>> last_job = client.get_last_job()
+            >>> last_job.invalidate_file_cache()
+        """
+        self.__root_file_cache = None
+        self.__root_file_index = None
+        self.__blob_cache = None
 
     def download_blob_by_type(
         self,
@@ -1733,13 +2008,13 @@ class Job(object):
         if download_dir is None:
             download_dir = os.getcwd()
 
-        blob_list = self.blob_list()
-        for b in blob_list:
+        blob_dir = os.path.join(self._job_dir(download_dir), "blob_files")
+        for b in self._cached_blob_list():
             if b.blob_type.name == blob_type:
-                self.download_blob_file(
-                    blob=b,
-                    download_dir=download_dir,
-                    to_timestamp_folder=to_timestamp_folder,
+                self._download_blob(
+                    b,
+                    self._blob_file_path(b, blob_dir, to_timestamp_folder),
+                    to_timestamp_folder,
                 )
 
     def download_mesh_file(self, download_dir: str = None):
@@ -1989,12 +2264,26 @@ class Job(object):
         simulations = response.simulations
         self.simulations = list()
         if simulations is not None:
-            for sim in simulations:
-                s = Simulation(simulation_data=sim, aes_key=self.__aes_key)
-                self.simulations.append(s)
+            self.simulations = [
+                Simulation(simulation_data=sim, aes_key_source=self._job_aes_key)
+                for sim in simulations
+            ]
             self._simulation_count = len(self.simulations)
         else:
             self._simulation_count = 0
+        self._index_simulations()
+
+    def _index_simulations(self):
+        """Builds the lookups of the simulations list by simulation id and index
+
+        Simulations without an index are indexed by their position in the list
+        """
+        self._sim_index_by_id = dict()
+        self._sim_by_index = dict()
+        for idx, s in enumerate(self.simulations):
+            sim_index = s.index if s.index is not None else idx
+            self._sim_index_by_id[s.id] = sim_index
+            self._sim_by_index[sim_index] = s
 
     def _populate_tag_list(self):
         """Populates the tag list
@@ -2037,13 +2326,13 @@ class Job(object):
             'barra'
         """
         if operation is not None:
-            if "REFLEX" in operation:
+            if operation.startswith("REFLEX"):
                 latest_tag = "develop-latest"
             elif operation in ("SIMULATION", "BUILD", "REVIEW"):
                 latest_tag = "barra"
                 if portal is not None and portal in ("test", "dev"):
                     latest_tag = latest_tag + "-beta"
-            if "MNMPI" in operation:
+            if operation.endswith("MNMPI"):
                 latest_tag = "mpi-" + latest_tag
             return latest_tag
         else:
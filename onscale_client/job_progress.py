@@ -1,10 +1,5 @@
 from typing import Dict, Optional
-from .common.client_settings import import_tqdm_notebook
-
-if import_tqdm_notebook():
-    from tqdm.notebook import tqdm  # type: ignore
-else:
-    from tqdm import tqdm  # type: ignore
+from .common.client_settings import get_tqdm
 
 
 class SimProgress(object):
@@ -20,7 +15,7 @@ class SimProgress(object):
         self.sim_id = sim_id
         self.progress_value = progress_value
         self.status = status
-        self.progress_bar = tqdm(
+        self.progress_bar = get_tqdm()(
             total=100,
             desc=f"{sim_id}:",
             bar_format="{l_bar}|{bar}|{n_fmt}/{total_fmt}",
@@ -5,7 +5,7 @@ import onscale_client.api.rest_api as rest_api
 from onscale_client.api.rest_api import rest_api as RestApi
 
 from .common.client_settings import ClientSettings
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 
 class Simulation(object):
@@ -14,7 +14,10 @@ class Simulation(object):
     """
 
     def __init__(
-        self, simulation_data: datamodel.Simulation = None, aes_key: str = None
+        self,
+        simulation_data: Optional[datamodel.Simulation] = None,
+        aes_key: Optional[str] = None,
+        aes_key_source: Optional[Callable[[], str]] = None,
     ):
         """initializes class which holds Simualtion data
 
@@ -22,9 +25,21 @@ class Simulation(object):
             data.  datamodel.Simulation object can be attained via datamodel.Job.simulations.
         :param aes_key: AES key used for encryption/decryption. This key should be
             the same as the parent job's aes key.
+        :param aes_key_source: Callable returning the AES key, called on first use
+            of the key if aes_key is not specified. Used by the parent job so the
+            key is requested once for the job rather than once per download.
         """
         self.__data = simulation_data
         self._aes_key = aes_key
+        self._aes_key_source = aes_key_source
+
+    @property
+    def aes_key(self) -> Optional[str]:
+        """AES key used for encryption/decryption, taken from aes_key_source on
+        first use if not specified"""
+        if self._aes_key is None and self._aes_key_source is not None:
+            self._aes_key = self._aes_key_source()
+        return self._aes_key
 
     @property
     def id(self):
@@ -137,6 +152,56 @@ class Simulation(object):
         sim.required_blobs = required_blobs
         return sim
 
+    @staticmethod
+    def bulk_default_sim_data(
+        job_id: str,
+        account_id: str,
+        count: int,
+        console_parameters: Optional[str] = None,
+        required_blobs: Optional[list] = None,
+    ) -> List[datamodel.Simulation]:
+        """returns a list of default simulation objects
+
+        Helper method equivalent to calling get_default_sim_data for each index
+        in range(count). Arguments are validated once for the whole list.
+
+        Args:
+            job_id: client job_id
+            account_id: client account id
+            count: int number of simulations to create
+            console_parameters: console_parameters to be passed for each simulation
+            required_blobs: list of blob id's indexed by simulation. The first
+                simulation never requires a blob.
+
+        Returns:
+            list of default simulations with specified parameters
+
+        Raises:
+           TypeError: job_id or account_id is not str
+           TypeError: count is not int
+        """
+        if not isinstance(job_id, str):
+            raise TypeError("TypeError: attr job_id must be str")
+        if not isinstance(account_id, str):
+            raise TypeError("TypeError: attr account_id must be str")
+        if not isinstance(count, int):
+            raise TypeError("TypeError: attr count must be int")
+        params = "IGNORE" if console_parameters is None else console_parameters
+
+        sim_list = []
+        for i in range(count):
+            blob = required_blobs[i] if required_blobs is not None else None
+            sim_list.append(
+                datamodel.Simulation.construct(
+                    job_id=job_id,
+                    account_id=account_id,
+                    console_parameters=params,
+                    simulation_index=i,
+                    required_blobs=None if (blob is None or i == 0) else [blob],
+                )
+            )
+        return sim_list
+
     def download_results(
         self,
         download_dir: str,
@@ -178,7 +243,8 @@ class Simulation(object):
             # standardize extension filter list. Add a "." if not already present
             extension_filter = [x if x[0] == "." else "." + x for x in extension_filter]
 
-        # get file list
+        # gather the matching files so they are downloaded in a single request
+        dl_list = list()
         file_list = self.file_list()
         for sim_file in file_list:
             if not isinstance(sim_file.file_name, str):
@@ -195,14 +261,17 @@ class Simulation(object):
                     if not any(ext in x for x in extension_filter):
                         continue
 
-            try:
-                RestApi.sim_file_download(
-                    files=[sim_file],
-                    file_path=download_dir,
-                    simulation_index=self.index,
-                )
-            except rest_api.ApiError as e:
-                print(f"APIError raised - {e.__str__()}")
+            dl_list.append(sim_file)
+
+        try:
+            RestApi.sim_file_download(
+                files=dl_list,
+                file_path=download_dir,
+                simulation_index=self.index,
+                aes_key=self.aes_key,
+            )
+        except rest_api.ApiError as e:
+            print(f"APIError raised - {e.__str__()}")
 
     def download_all(self, download_dir: str):
         """Download all files associate with this simulation
@@ -217,14 +286,15 @@ class Simulation(object):
             >>> sim = last_job.simulations[0]
             >>> sim.download_all('/tmp/job_download')
         """
-        file_list = self.file_list()
-        for f in file_list:
-            try:
-                RestApi.sim_file_download(
-                    files=[f], file_path=download_dir, simulation_index=self.index
-                )
-            except rest_api.ApiError as e:
-                print(f"APIError raised - {e.__str__()}")
+        try:
+            RestApi.sim_file_download(
+                files=self.file_list(),
+                file_path=download_dir,
+                simulation_index=self.index,
+                aes_key=self.aes_key,
+            )
+        except rest_api.ApiError as e:
+            print(f"APIError raised - {e.__str__()}")
 
     def download_file(self, file_name: str, download_dir: str):
         """Download specific file associate with this simulation
@@ -246,17 +316,20 @@ class Simulation(object):
             >>> sim.download_file(file_name=file_list[0].file_name,
             ...                        download_dir='/tmp/job_download')
         """
-        file_list = self.file_list()
-        for f in file_list:
-            if not isinstance(f.file_name, str):
-                continue
-            if file_name in f.file_name:
-                try:
-                    RestApi.sim_file_download(
-                        files=[f], file_path=download_dir, simulation_index=self.index
-                    )
-                except rest_api.ApiError as e:
-                    print(f"APIError raised - {e.__str__()}")
+        dl_list = [
+            f
+            for f in self.file_list()
+            if isinstance(f.file_name, str) and file_name in f.file_name
+        ]
+        try:
+            RestApi.sim_file_download(
+                files=dl_list,
+                file_path=download_dir,
+                simulation_index=self.index,
+                aes_key=self.aes_key,
+            )
+        except rest_api.ApiError as e:
+            print(f"APIError raised - {e.__str__()}")
 
     def file_list(self) -> List[datamodel.JobFile]:
         """Returns a list of the files for this simulation.
@@ -49,7 +49,7 @@ class SocketListener(ABC):
         """Handle a message received from the websocket"""
         pass
 
-    def listen(self, timeout_secs: int = None):
+    def listen(self, timeout_secs: Optional[int] = None):
         """Listen to the websocket until self.poll_complete() is True"""
         try:
             loop = asyncio.new_event_loop()
@@ -82,7 +82,7 @@ class SocketListener(ABC):
         self.kill()
         raise exc
 
-    async def _run(self, timeout_secs: int = None):
+    async def _run(self, timeout_secs: Optional[int] = None):
         """Run a tight poll loop until killed or poll_complete() is True"""
         listen_task = asyncio.create_task(self._listen())
 